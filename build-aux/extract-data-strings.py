@@ -2,8 +2,23 @@
 
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# ijson lets us stream the large data files instead of materializing the whole
+# JSON tree just to pick out a handful of string fields. It is an optional
+# build dependency; without it we fall back to the json.load tree walk.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson speeds up the non-streaming fallback path; also optional.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration ---
 POT_HEADER = r'''# Translation template for All-in-One Clipboard data content.
 # Copyright (C) 2025 YOUR NAME
@@ -25,37 +40,129 @@ msgstr ""
 
 '''
 
+def _with_unrooted(prefixes):
+    """Adds the bare-list variants of the prefixes, for pre-finalized files
+    whose top level is the data array itself rather than a 'data' wrapper."""
+    return frozenset(prefixes) | frozenset(p[len('data.'):] for p in prefixes)
+
+# The JSONPath prefixes (rooted at the top-level 'data' key) that hold
+# translatable strings in each finalized data file. The unrooted variants
+# cover files that have not been through json_final_exporter yet.
+STREAM_PREFIXES = {
+    "emojis.json": _with_unrooted([
+        'data.item.name',
+        'data.item.emojis.item.name',
+        'data.item.emojis.item.keywords.item',
+    ]),
+    "kaomojis.json": _with_unrooted([
+        'data.item.name',
+        'data.item.categories.item.name',
+        'data.item.categories.item.emoticons.item.description',
+        'data.item.categories.item.emoticons.item.keywords.item',
+    ]),
+    "symbols.json": _with_unrooted([
+        'data.item.name',
+        'data.item.symbols.item.name',
+    ]),
+}
+
+# Translation table for POT escaping: one C-level pass instead of two
+# chained .replace() scans with an intermediate copy.
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
 # --- Main Logic ---
 def escape_string(s):
     """Escapes quotes and backslashes for POT format."""
-    return s.replace('\\', '\\\\').replace('"', '\\"')
+    return s.translate(_ESCAPE_TABLE)
 
-def extract_emoji_strings(data_array, string_set):
+def stream_strings(json_file_path, wanted_prefixes, string_dict):
+    """Streams a JSON file with ijson, collecting strings at the wanted prefixes."""
+    with open(json_file_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if event == 'string' and prefix in wanted_prefixes:
+                string_dict[sys.intern(value)] = None
+
+def extract_emoji_strings(data_array, string_dict):
     """Extracts all translatable strings from the emojis data structure."""
-    for category in data_array:
-        string_set.add(category.get('name', ''))
-        for emoji in category.get('emojis', []):
-            string_set.add(emoji.get('name', ''))
-            for keyword in emoji.get('keywords', []):
-                string_set.add(keyword)
-
-def extract_kaomoji_strings(data_array, string_set):
+    # Batched update() calls keep the per-string work inside the C-level
+    # dict machinery instead of one Python-level insert per string.
+    string_dict.update(dict.fromkeys(
+        category.get('name', '') for category in data_array))
+    string_dict.update(dict.fromkeys(
+        emoji.get('name', '')
+        for category in data_array
+        for emoji in category.get('emojis', ())))
+    string_dict.update(dict.fromkeys(
+        sys.intern(keyword)
+        for category in data_array
+        for emoji in category.get('emojis', ())
+        for keyword in emoji.get('keywords', ())))
+
+def extract_kaomoji_strings(data_array, string_dict):
     """Extracts all translatable strings from the kaomojis data structure."""
-    for greater_category in data_array:
-        string_set.add(greater_category.get('name', ''))
-        for inner_category in greater_category.get('categories', []):
-            string_set.add(inner_category.get('name', ''))
-            for emoticon in inner_category.get('emoticons', []):
-                string_set.add(emoticon.get('description', ''))
-                for keyword in emoticon.get('keywords', []):
-                    string_set.add(keyword)
-
-def extract_symbol_strings(data_array, string_set):
+    string_dict.update(dict.fromkeys(
+        greater_category.get('name', '') for greater_category in data_array))
+    string_dict.update(dict.fromkeys(
+        inner_category.get('name', '')
+        for greater_category in data_array
+        for inner_category in greater_category.get('categories', ())))
+    string_dict.update(dict.fromkeys(
+        emoticon.get('description', '')
+        for greater_category in data_array
+        for inner_category in greater_category.get('categories', ())
+        for emoticon in inner_category.get('emoticons', ())))
+    string_dict.update(dict.fromkeys(
+        sys.intern(keyword)
+        for greater_category in data_array
+        for inner_category in greater_category.get('categories', ())
+        for emoticon in inner_category.get('emoticons', ())
+        for keyword in emoticon.get('keywords', ())))
+
+def extract_symbol_strings(data_array, string_dict):
     """Extracts all translatable strings from the symbols data structure."""
-    for category in data_array:
-        string_set.add(category.get('name', ''))
-        for symbol in category.get('symbols', []):
-            string_set.add(symbol.get('name', ''))
+    string_dict.update(dict.fromkeys(
+        category.get('name', '') for category in data_array))
+    string_dict.update(dict.fromkeys(
+        symbol.get('name', '')
+        for category in data_array
+        for symbol in category.get('symbols', ())))
+
+# A map to link filenames to their specific extraction function.
+FILE_PROCESSORS = {
+    "emojis.json": extract_emoji_strings,
+    "kaomojis.json": extract_kaomoji_strings,
+    "symbols.json": extract_symbol_strings
+}
+
+def extract_file_strings(json_file_path, filename):
+    """Extracts all translatable strings from a single data file into a dict."""
+    strings = {}
+    try:
+        if ijson is not None:
+            # Stream the file, collecting only the strings we actually keep.
+            stream_strings(json_file_path, STREAM_PREFIXES[filename], strings)
+        else:
+            # Load the whole object, then pass the '.data' part to the processor.
+            if orjson is not None:
+                full_data_object = orjson.loads(Path(json_file_path).read_bytes())
+            else:
+                full_data_object = json.loads(Path(json_file_path).read_bytes())
+            # Finalized files wrap the payload in a 'data' key; pre-finalized
+            # files are the bare data array.
+            if isinstance(full_data_object, dict):
+                data_array = full_data_object.get('data')
+            else:
+                data_array = full_data_object
+
+            if data_array is None:
+                print(f"Error: Could not find 'data' key in '{json_file_path}'. Is the file finalized?")
+                return strings
+
+            # Call the correct function for this file type.
+            FILE_PROCESSORS[filename](data_array, strings)
+    except (json.JSONDecodeError, Exception) as e:
+        print(f"Error processing '{json_file_path}': {e}")
+    return strings
 
 # --- Main Logic ---
 def main():
@@ -66,47 +173,39 @@ def main():
     output_file = Path(sys.argv[1])
     input_dir = Path(sys.argv[2])
 
-    translatable_strings = set()
-
-    # A map to link filenames to their specific extraction function.
-    file_processors = {
-        "emojis.json": extract_emoji_strings,
-        "kaomojis.json": extract_kaomoji_strings,
-        "symbols.json": extract_symbol_strings
-    }
+    # Insertion-ordered dict used as a set: deterministic iteration order
+    # across runs (sets are hash-randomized) while still deduplicating.
+    translatable_strings = {}
 
-    # Process each configured JSON file.
-    for filename, processor_func in file_processors.items():
+    # The data files are independent, so extract them in parallel; each worker
+    # returns its own dict and the only shared step is the final union.
+    pending = []
+    for filename in FILE_PROCESSORS:
         json_file_path = input_dir / filename
         if not json_file_path.exists():
             print(f"Warning: '{json_file_path}' not found, skipping.")
             continue
+        pending.append((json_file_path, filename))
 
-        try:
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                # Load the whole object, then pass the '.data' part to the processor.
-                full_data_object = json.load(f)
-                data_array = full_data_object.get('data')
-
-                if data_array is None:
-                    print(f"Error: Could not find 'data' key in '{json_file_path}'. Is the file finalized?")
-                    continue
-
-                # Call the correct function for this file type.
-                processor_func(data_array, translatable_strings)
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"Error processing '{json_file_path}': {e}")
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(extract_file_strings, path, name) for path, name in pending]
+        for future in futures:
+            translatable_strings.update(future.result())
 
     # Write to the .pot file.
-    translatable_strings.discard('')
-
-    sorted_strings = sorted(list(translatable_strings))
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(POT_HEADER)
-        for s in sorted_strings:
-            f.write('#: extension/data/*.json\n')
-            f.write(f'msgid "{escape_string(s)}"\n')
-            f.write('msgstr ""\n\n')
+    translatable_strings.pop('', None)
+
+    sorted_strings = sorted(translatable_strings)
+
+    # Build the whole .pot content in memory and emit it with a single
+    # write() instead of three small writes per string.
+    parts = [POT_HEADER]
+    parts.extend(
+        f'#: extension/data/*.json\nmsgid "{escape_string(s)}"\nmsgstr ""\n\n'
+        for s in sorted_strings
+    )
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(''.join(parts))
 
     print(f"Generated {output_file} with {len(sorted_strings)} unique strings.")
 
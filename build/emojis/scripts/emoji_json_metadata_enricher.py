@@ -1,22 +1,62 @@
 # ./scripts/emoji_json_metadata_enricher.py
 import json
 import pathlib
+import sys
 
-def enrich_emoji_file_with_codepoints(input_path, output_path):
-    """
-    Loads the emojis.json file, adds a "codepoints" list to each emoji
-    object, and saves the result to a new file.
+# orjson parses raw UTF-8 bytes in C, several times faster than stdlib
+# json. It is an optional dependency with a stdlib fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Cache of codepoint -> "U+XXXX" string. Many codepoints (ZWJ, VS16, skin
+# tones, regional indicators) repeat thousands of times across the dataset;
+# caching shares one interned string object instead of formatting a new one.
+_CODEPOINT_CACHE = {}
+
+def _codepoint_string(codepoint):
+    """Returns the cached "U+XXXX" string for a codepoint, formatting it once."""
+    cached = _CODEPOINT_CACHE.get(codepoint)
+    if cached is None:
+        cached = _CODEPOINT_CACHE[codepoint] = sys.intern(f"U+{codepoint:04X}")
+    return cached
+
+# Cache of whole emoji string -> codepoint list, so an emoji that appears
+# more than once in the dataset shares a single list object and skips the
+# per-character decode entirely.
+_STRING_CODEPOINTS_CACHE = {}
+
+def _codepoints_for(emoji_string):
+    """Returns the (shared) list of "U+XXXX" strings for an emoji string."""
+    cached = _STRING_CODEPOINTS_CACHE.get(emoji_string)
+    if cached is None:
+        cached = [_codepoint_string(o) for o in map(ord, emoji_string)]
+        _STRING_CODEPOINTS_CACHE[emoji_string] = cached
+    return cached
+
+def build_data(input_path=None):
+    """Loads the emojis.json file, enriches it, and returns the data.
+
+    Exposed so json_final_exporter can consume the data in-process instead
+    of re-parsing the intermediate JSON file. Returns None on load errors.
     """
+    if input_path is None:
+        input_path = INPUT_FILE_PATH
+
     try:
-        with open(input_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            print(f"Successfully loaded '{input_path}'.")
+        if orjson is not None:
+            data = orjson.loads(pathlib.Path(input_path).read_bytes())
+        else:
+            with open(input_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        print(f"Successfully loaded '{input_path}'.")
     except FileNotFoundError:
         print(f"Error: The input file '{input_path}' was not found.")
-        return
+        return None
     except Exception as e:
         print(f"An error occurred loading the file: {e}")
-        return
+        return None
 
     print("Enriching emoji objects with codepoints...")
 
@@ -30,12 +70,20 @@ def enrich_emoji_file_with_codepoints(input_path, output_path):
                     # Get the emoji character string (which could be multi-char)
                     emoji_string = emoji_object['emoji']
 
-                    # Create a list of codepoint strings from the character(s)
-                    # This list comprehension handles both single and multi-char emojis perfectly.
-                    codepoints = [f"U+{ord(char):04X}" for char in emoji_string]
+                    # Look up (or build once) the codepoint strings for the
+                    # character(s); handles single and multi-char emojis alike.
+                    emoji_object['codepoints'] = _codepoints_for(emoji_string)
 
-                    # Add the new 'codepoints' field to the object
-                    emoji_object['codepoints'] = codepoints
+    return data
+
+def enrich_emoji_file_with_codepoints(input_path, output_path):
+    """
+    Loads the emojis.json file, adds a "codepoints" list to each emoji
+    object, and saves the result to a new file.
+    """
+    data = build_data(input_path)
+    if data is None:
+        return
 
     # Write the newly enriched data to the output file
     try:
@@ -46,18 +94,18 @@ def enrich_emoji_file_with_codepoints(input_path, output_path):
     except Exception as e:
         print(f"An error occurred while saving the file: {e}")
 
-# --- SCRIPT EXECUTION ---
+# --- Configuration ---
 
 # Get the directory where this script is located
 SCRIPT_DIR = pathlib.Path(__file__).parent.resolve()
+PROJECT_ROOT = SCRIPT_DIR.parent
 
-# Define the input and output filenames
-input_filename = "emojis.json"  # Your existing file
-output_filename = "emojis_detailed.json" # A new file for the improved data
+# The input and output files live next to the scripts directory, matching
+# the layout the sibling kaomoji/symbol scripts use.
+INPUT_FILE_PATH = PROJECT_ROOT / "emojis.json"  # Your existing file
+OUTPUT_FILE_PATH = PROJECT_ROOT / "emojis_detailed.json" # A new file for the improved data
 
-# Construct the full paths for the files
-input_file_path = SCRIPT_DIR / input_filename
-output_file_path = SCRIPT_DIR / output_filename
-
-# Run the enrichment process
-enrich_emoji_file_with_codepoints(input_file_path, output_file_path)
\ No newline at end of file
+# --- SCRIPT EXECUTION ---
+if __name__ == '__main__':
+    # Run the enrichment process
+    enrich_emoji_file_with_codepoints(INPUT_FILE_PATH, OUTPUT_FILE_PATH)
\ No newline at end of file
@@ -1,9 +1,19 @@
 import argparse
+import functools
+import importlib.util
 import json
 import hashlib
+import os
 import sys
 from pathlib import Path
 
+# orjson serializes in C at several times stdlib json's speed. It is an
+# optional dependency; everything falls back to stdlib json without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration Section ---
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -23,6 +33,15 @@ INTERNAL_DEFAULTS = {
     "symbol": "symbols_detailed.json"
 }
 
+# The upstream script that can build each data type in-process, so
+# --in-memory runs skip the intermediate JSON parse entirely. Each module
+# exposes a build_data() function returning the data list.
+IN_MEMORY_BUILDERS = {
+    "emoji": "emoji_json_metadata_enricher",
+    "kaomoji": "kaomojis_json_data_cleaner",
+    "symbol": "symbols_json_metadata_enricher"
+}
+
 # Central place to define attributions.
 ATTRIBUTIONS = {
     "emoji": {
@@ -43,13 +62,13 @@ ATTRIBUTIONS = {
 }
 
 # --- Helper Functions ---
+@functools.lru_cache(maxsize=1)
 def load_and_merge_config():
     """Loads default source files with a clear priority."""
     effective_defaults = INTERNAL_DEFAULTS.copy()
     if CONFIG_FILE_PATH.exists():
         try:
-            with open(CONFIG_FILE_PATH, 'r', encoding='utf-8') as f:
-                user_config = json.load(f)
+            user_config = json.loads(CONFIG_FILE_PATH.read_bytes())
             user_sources = user_config.get("default_sources", {})
             if user_sources:
                 effective_defaults.update(user_sources)
@@ -62,12 +81,12 @@ def load_and_merge_config():
         print(f"INFO: No '{CONFIG_FILE_PATH}' found. Using internal defaults.")
     return effective_defaults
 
+@functools.lru_cache(maxsize=1)
 def load_extension_metadata():
     """Loads static metadata from the extension's metadata.json file."""
     metadata_path = PROJECT_ROOT / 'extension' / 'metadata.json'
     try:
-        with open(metadata_path, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
+        metadata = json.loads(metadata_path.read_bytes())
 
         return {
             "name": metadata.get("name"),
@@ -77,67 +96,66 @@ def load_extension_metadata():
         print("Warning: Could not load extension/metadata.json. Will skip embedding this info.", file=sys.stderr)
         return None
 
+def build_data_in_memory(data_type):
+    """Imports the upstream builder script and returns its freshly built data."""
+    directory_name = TYPE_TO_DIRECTORY_MAP[data_type]
+    module_name = IN_MEMORY_BUILDERS[data_type]
+    script_path = PROJECT_ROOT / 'build' / directory_name / 'scripts' / f'{module_name}.py'
+
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.build_data()
+
+def _safe_float(value):
+    """Converts a version string to float, treating unparsable values as 0.0."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
 def get_emoji_version(data_list):
     """Parses emoji data to find the highest Unicode version number."""
-    max_version = 0.0
     try:
-        for category in data_list:
-            for emoji in category.get("emojis", []):
-                version_str = emoji.get("unicode_version", "0.0")
-                try:
-                    version_float = float(version_str)
-                    if version_float > max_version:
-                        max_version = version_float
-                except (ValueError, TypeError):
-                    continue
+        return str(max(
+            (_safe_float(emoji.get("unicode_version", "0.0"))
+             for category in data_list
+             for emoji in category.get("emojis", ())),
+            default=0.0))
     except Exception as e:
         print(f"Warning: Could not determine emoji version due to unexpected data structure. Error: {e}", file=sys.stderr)
         return "unknown"
-    return str(max_version)
 
 def get_content_hash(data_list):
-    """Calculates the SHA256 hash of the JSON data to create a unique version string."""
-    data_string = json.dumps(data_list, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
-    hash_object = hashlib.sha256(data_string.encode('utf-8'))
+    """Calculates the SHA256 hash of the JSON data to create a unique version string.
+
+    The hashed bytes are the canonical compact JSON form (sorted keys, no
+    whitespace, raw UTF-8). Keep this form stable: published data_version
+    strings change whenever the canonical encoding changes.
+    """
+    hash_object = hashlib.sha256()
+    if orjson is not None:
+        # orjson's sorted compact output is byte-identical to the stdlib
+        # encoder below, so the hash is stable across both paths.
+        hash_object.update(orjson.dumps(data_list, option=orjson.OPT_SORT_KEYS))
+    else:
+        # Feed the encoder's fragments straight into the hash instead of
+        # materializing one multi-MB string plus its UTF-8 copy.
+        encoder = json.JSONEncoder(sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        for chunk in encoder.iterencode(data_list):
+            hash_object.update(chunk.encode('utf-8'))
     return f"sha256:{hash_object.hexdigest()[:16]}"
 
-def main():
+def run_export(data_type, input_specifier=None, destination_file=None, indent=2, in_memory=False):
+    """Finalizes one data type: resolves paths, versions the data, writes the file."""
     final_defaults = load_and_merge_config()
 
-    parser = argparse.ArgumentParser(
-        description="Finalizes a JSON data file by adding metadata and copying it to the extension directory."
-    )
-    parser.add_argument(
-        "-i", "--input",
-        dest="input_specifier",
-        type=str,
-        help="A filename to use from the default directory (e.g., 'file.json'), OR a full/relative path to override the default location."
-    )
-    parser.add_argument(
-        "-o", "--output",
-        dest="destination_file",
-        type=Path,
-        help="Override the default output file path.")
-    parser.add_argument(
-        "-t", "--type",
-        required=True,
-        choices=['emoji', 'kaomoji', 'symbol'],
-        help="The type of data being processed.")
-    parser.add_argument(
-        "--indent",
-        type=int,
-        default=2,
-        help="The number of spaces to use for indentation in the output JSON. Default is 2."
-    )
-
-    args = parser.parse_args()
-
     # --- 1. Determine Input and Output Paths ---
-    input_spec = args.input_specifier
+    input_spec = input_specifier
     source_file = None
 
     # Get the correct plural directory name from our map.
-    directory_name = TYPE_TO_DIRECTORY_MAP[args.type]
+    directory_name = TYPE_TO_DIRECTORY_MAP[data_type]
     # Build the full, correct base path.
     default_base_dir = PROJECT_ROOT / 'build' / directory_name
 
@@ -150,35 +168,47 @@ def main():
             source_file = input_path
             print(f"INFO: Interpreted '{input_spec}' as an explicit path.")
     else:
-        default_filename = final_defaults[args.type]
+        default_filename = final_defaults[data_type]
         source_file = default_base_dir / default_filename
         print(f"INFO: No input specified. Using configured default: '{default_filename}'")
 
     print(f"  > Final source path: '{source_file}'")
 
-    destination_file = args.destination_file
     if not destination_file:
-        destination_file = PROJECT_ROOT / 'extension' / 'data' / f'{args.type}s.json'
+        destination_file = PROJECT_ROOT / 'extension' / 'data' / f'{data_type}s.json'
         print(f"INFO: No output specified. Using default destination.")
 
     print(f"  > Final destination path: '{destination_file}'")
 
-    # --- 2. Load Source File and Extension Metadata ---
-    try:
-        with open(source_file, 'r', encoding='utf-8') as f:
-            source_data = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: Source file not found at '{source_file}'", file=sys.stderr)
-        sys.exit(1)
-    except json.JSONDecodeError:
-        print(f"Error: Could not parse JSON from '{source_file}'.", file=sys.stderr)
-        sys.exit(1)
+    # --- 2. Load Source Data and Extension Metadata ---
+    if in_memory:
+        # Build the data in-process via the upstream script, skipping the
+        # intermediate JSON file's serialize + parse round-trip.
+        print(f"INFO: Building '{data_type}' data in-memory, ignoring the source file.")
+        source_data = build_data_in_memory(data_type)
+        if source_data is None:
+            print(f"Error: In-memory builder for '{data_type}' produced no data.", file=sys.stderr)
+            sys.exit(1)
+    else:
+        try:
+            if orjson is not None:
+                # Read raw bytes and parse in C; orjson handles the UTF-8
+                # decode itself, skipping the TextIOWrapper entirely.
+                source_data = orjson.loads(source_file.read_bytes())
+            else:
+                source_data = json.loads(source_file.read_bytes())
+        except FileNotFoundError:
+            print(f"Error: Source file not found at '{source_file}'", file=sys.stderr)
+            sys.exit(1)
+        except ValueError:
+            print(f"Error: Could not parse JSON from '{source_file}'.", file=sys.stderr)
+            sys.exit(1)
 
     extension_info = load_extension_metadata()
-    print(f"\nProcessing '{source_file}' as type '{args.type}'...")
+    print(f"\nProcessing '{source_file}' as type '{data_type}'...")
 
     # --- 3. Determine Data Version ---
-    if args.type == 'emoji':
+    if data_type == 'emoji':
         data_version = get_emoji_version(source_data)
     else:
         data_version = get_content_hash(source_data)
@@ -188,22 +218,77 @@ def main():
     final_json_structure = {
         "_metadata": {
             "data_version": data_version,
-            "attribution": ATTRIBUTIONS.get(args.type),
+            "attribution": ATTRIBUTIONS.get(data_type),
             "extension_info": extension_info
         },
         "data": source_data
     }
 
     # --- 5. Write the Finalized File ---
+    # Write to a temp file next to the destination and rename it into place,
+    # so readers never observe a half-written data file.
+    temp_file = destination_file.with_suffix(destination_file.suffix + '.tmp')
     try:
         destination_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(destination_file, 'w', encoding='utf-8') as f:
-            json.dump(final_json_structure, f, indent=args.indent, ensure_ascii=False)
+        if orjson is not None and indent == 2:
+            # Fast path: orjson pretty-prints at near-raw throughput, but only
+            # supports 2-space indentation. Its output matches stdlib json's
+            # indent=2 formatting byte for byte.
+            temp_file.write_bytes(orjson.dumps(final_json_structure, option=orjson.OPT_INDENT_2))
+        else:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(final_json_structure, f, indent=indent, ensure_ascii=False)
+        os.replace(temp_file, destination_file)
     except Exception as e:
         print(f"\nError: Could not write to destination file '{destination_file}'. Error: {e}", file=sys.stderr)
         sys.exit(1)
 
     print(f"\n✅ Success! Finalized data written to '{destination_file}'")
 
+def main_batch(types=('emoji', 'kaomoji', 'symbol')):
+    """Exports several data types in one process.
+
+    The config and extension metadata loads are cached, so a batch run
+    parses them once instead of once per interpreter invocation.
+    """
+    for data_type in types:
+        run_export(data_type)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Finalizes a JSON data file by adding metadata and copying it to the extension directory."
+    )
+    parser.add_argument(
+        "-i", "--input",
+        dest="input_specifier",
+        type=str,
+        help="A filename to use from the default directory (e.g., 'file.json'), OR a full/relative path to override the default location."
+    )
+    parser.add_argument(
+        "-o", "--output",
+        dest="destination_file",
+        type=Path,
+        help="Override the default output file path.")
+    parser.add_argument(
+        "-t", "--type",
+        required=True,
+        choices=['emoji', 'kaomoji', 'symbol'],
+        help="The type of data being processed.")
+    parser.add_argument(
+        "--indent",
+        type=int,
+        default=2,
+        help="The number of spaces to use for indentation in the output JSON. Default is 2."
+    )
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Build the data in-process via the upstream script instead of reading the intermediate JSON file."
+    )
+
+    args = parser.parse_args()
+
+    run_export(args.type, args.input_specifier, args.destination_file, args.indent, args.in_memory)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,113 +1,281 @@
 import json
 import argparse
+import sys
+import multiprocessing
 import os
-from collections import OrderedDict
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Optional C-accelerated JSON parser; stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson (optional) lets us derive the structure from a stream of parse
+# events, so memory stays proportional to nesting depth instead of file
+# size and huge data files can be analyzed without loading them whole.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors that mean "this file is not valid JSON": stdlib json and orjson
+# raise ValueError subclasses, ijson raises its own JSONError.
+_DECODE_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
+def collect_json_paths(root):
+    """
+    Enumerates all .json files under a directory tree using os.scandir on a
+    small pool of threads.
+
+    Unlike os.walk, which enumerates serially in the calling thread, four
+    worker threads share a queue of directories and feed newly discovered
+    subdirectories back into it, so the readdir syscalls overlap. scandir's
+    DirEntry objects carry cached type info, sparing a stat per entry.
+    """
+    json_paths = []
+    paths_lock = threading.Lock()
+    dir_queue = queue.Queue()
+    dir_queue.put(root)
+
+    def scan_worker():
+        while True:
+            directory = dir_queue.get()
+            if directory is None:
+                return
+            subdirs = []
+            found = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith('.json') and entry.is_file(follow_symlinks=False):
+                            found.append(entry.path)
+            except OSError:
+                pass
+            if found:
+                with paths_lock:
+                    json_paths.extend(found)
+            for subdir in subdirs:
+                dir_queue.put(subdir)
+            dir_queue.task_done()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(4):
+            executor.submit(scan_worker)
+        # Wait until every queued directory has been scanned, then wake the
+        # workers with one sentinel each so they exit.
+        dir_queue.join()
+        for _ in range(4):
+            dir_queue.put(None)
+    return json_paths
+
+
+# Exact-type dispatch table for get_data_type. A single dict lookup on
+# type(value) replaces up to seven isinstance calls per value, and because
+# type(True) is bool the chain's careful bool-before-int ordering is no
+# longer needed.
+_TYPE_MAP = {
+    list: "Array",
+    dict: "Object",
+    str: "String",
+    bool: "Boolean",
+    int: "Integer",
+    float: "Float",
+    type(None): "Null",
+}
 
 def get_data_type(value):
     """
     Returns the appropriate type name for a value.
     Handles special cases for lists and objects.
     """
-    if isinstance(value, list):
-        return "Array"
-    elif isinstance(value, dict):
-        return "Object"
-    elif isinstance(value, str):
-        return "String"
-    elif isinstance(value, bool):
-        return "Boolean"
-    elif isinstance(value, int):
-        return "Integer"
-    elif isinstance(value, float):
-        return "Float"
-    elif value is None:
-        return "Null"
-    else:
+    type_name = _TYPE_MAP.get(type(value))
+    if type_name is None:
         return str(type(value))
+    return type_name
 
 def analyze_json_structure(data, structure=None):
     """
-    Recursively analyzes the JSON data to determine its structure and data types.
+    Analyzes the JSON data to determine its structure and data types.
+
+    Traversal is iterative: an explicit stack of (value, target) pairs
+    replaces the former recursion, so each node costs a loop iteration
+    instead of a Python frame and arbitrarily deep JSON cannot raise
+    RecursionError.
     """
     if structure is None:
-        structure = OrderedDict()
-
-    # Handle the case where the top level is a list (JSON array)
-    if isinstance(data, list):
-        if not data:
-            structure["<Array Contents>"] = "Empty Array"
-            return structure
-
-        # Analyze only the first element as a representative sample
-        sample_element = data[0]
-        array_structure = OrderedDict()
-
-        analyze_json_structure(sample_element, array_structure)
-
-        structure["<Array: Items structure>"] = array_structure
-
-    # Handle the case where the top level is an object (JSON object)
-    elif isinstance(data, dict):
-        for key, value in data.items():
-            data_type = get_data_type(value)
-
-            if data_type == "Object":
-                # Recurse for nested objects
-                structure[key] = analyze_json_structure(value, OrderedDict())
-            elif data_type == "Array":
-                # Handle lists within the object
-                list_structure = OrderedDict()
-                analyze_json_structure(value, list_structure)
-                structure[key] = list_structure
-            else:
-                # Simple value
-                structure[key] = data_type
+        structure = {}
+
+    stack = [(data, structure)]
+    while stack:
+        value, target = stack.pop()
+
+        # A list contributes its sampled-first-element structure
+        if isinstance(value, list):
+            if not value:
+                target["<Array Contents>"] = "Empty Array"
+                continue
+            # Analyze only the first element as a representative sample
+            array_structure = {}
+            target["<Array: Items structure>"] = array_structure
+            stack.append((value[0], array_structure))
+
+        # An object contributes one entry per key
+        elif isinstance(value, dict):
+            for key, child in value.items():
+                data_type = get_data_type(child)
+                if data_type == "Object" or data_type == "Array":
+                    child_structure = {}
+                    target[key] = child_structure
+                    stack.append((child, child_structure))
+                else:
+                    # Simple value
+                    target[key] = data_type
+
+        # A bare scalar (only possible at the top level) adds nothing,
+        # matching the old recursive behavior.
 
     return structure
 
-def print_structure(structure, indent=0):
+def analyze_json_stream(file_handle):
+    """
+    Builds the same structure tree as analyze_json_structure, but from
+    ijson parse events instead of an in-memory object.
+
+    Only the first element of every array is analyzed (matching the
+    sampling done by analyze_json_structure); the remaining elements are
+    drained without building any Python objects, so peak memory is
+    O(nesting depth) rather than O(file size).
     """
-    Prints the analyzed structure in a readable, hierarchical format.
+    root = None
+    # Stack frames mirror the currently open containers:
+    #   ['map', structure_dict, pending_key]
+    #   ['array', structure_dict, seen_first_element]
+    stack = []
+    # While > 0, we are draining the rest of an already-sampled array and
+    # only track container depth so we can find its matching end_array.
+    skip_depth = 0
+
+    def attach(completed):
+        """Attaches a finished child (structure dict or type name) to its parent."""
+        nonlocal root, skip_depth
+        if not stack:
+            # Top level. A scalar document yields an empty structure, just
+            # like analyze_json_structure on a non-container value.
+            root = completed if isinstance(completed, dict) else {}
+            return
+        frame = stack[-1]
+        if frame[0] == 'map':
+            frame[1][frame[2]] = completed
+        else:
+            # First array element: record its structure (scalars sample as
+            # an empty dict) and skip the array's remaining elements.
+            frame[1]["<Array: Items structure>"] = completed if isinstance(completed, dict) else {}
+            frame[2] = True
+            skip_depth = 1
+
+    for _, event, value in ijson.parse(file_handle, use_float=True):
+        if skip_depth:
+            if event in ('start_map', 'start_array'):
+                skip_depth += 1
+            elif event in ('end_map', 'end_array'):
+                skip_depth -= 1
+                if skip_depth == 0:
+                    # The sampled array itself just closed.
+                    attach(stack.pop()[1])
+            continue
+
+        if event == 'map_key':
+            stack[-1][2] = value
+        elif event == 'start_map':
+            stack.append(['map', {}, None])
+        elif event == 'start_array':
+            stack.append(['array', {}, False])
+        elif event == 'end_map':
+            attach(stack.pop()[1])
+        elif event == 'end_array':
+            frame = stack.pop()
+            if not frame[2]:
+                frame[1]["<Array Contents>"] = "Empty Array"
+            attach(frame[1])
+        else:
+            # Scalar value event (string/number/boolean/null).
+            attach(get_data_type(value))
+
+    return root if root is not None else {}
+
+# Indent strings precomputed for the formatting loop; depths past 31 fall
+# back to multiplying on the fly.
+_INDENTS = ["    " * depth for depth in range(32)]
+
+def _format_structure(structure, lines, indent=0):
+    """
+    Formats the analyzed structure into readable, hierarchical lines,
+    appending them to the given list (no I/O happens here).
     """
     for key, value in structure.items():
         # Indentation for hierarchy
-        print("    " * indent, end="")
+        pad = _INDENTS[indent] if indent < 32 else "    " * indent
 
         if isinstance(value, dict):
             # Nested object or array structure
-            print(f"🔹 {key} (Object/Array):")
-            print_structure(value, indent + 1)
+            lines.append(f"{pad}🔹 {key} (Object/Array):")
+            _format_structure(value, lines, indent + 1)
         else:
             # Key with a simple type
-            print(f"🔸 {key}: {value}")
+            lines.append(f"{pad}🔸 {key}: {value}")
 
-def process_file(file_path):
+def render_file_report(file_path):
     """
-    Loads, analyzes, and prints the structure of a single JSON file.
+    Loads and analyzes a single JSON file, returning the full report as one
+    string. Lines are accumulated in a list and joined once, so rendering
+    a large structure performs a single write instead of two print calls
+    per node. Used directly as the process-pool worker for recursive runs.
     """
+    lines = []
     try:
-        # Step 1. Load the JSON data from the file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        print("\n" + "="*80)
-        print(f"🔎 Analyzing JSON structure for: **{file_path}**")
-        print("="*80)
+        # Steps 1+2. Parse and analyze. The streaming path never holds the
+        # whole document in memory; without ijson we load it and walk it.
+        if ijson is not None:
+            with open(file_path, 'rb') as f:
+                json_structure = analyze_json_stream(f)
+        else:
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'rb') as f:
+                    data = json.loads(f.read())
+            json_structure = analyze_json_structure(data)
 
-        # Step 2. Analyze the structure
-        json_structure = analyze_json_structure(data)
+        lines.append("\n" + "="*80)
+        lines.append(f"🔎 Analyzing JSON structure for: **{file_path}**")
+        lines.append("="*80)
 
-        # Step 3. Print the results
-        print_structure(json_structure)
-        print("="*80)
+        # Step 3. Format the results
+        _format_structure(json_structure, lines)
+        lines.append("="*80)
 
     except FileNotFoundError:
-        print(f"❌ Error: The file '{file_path}' was not found.")
-    except json.JSONDecodeError as e:
-        print(f"❌ Error: Invalid JSON format in '{file_path}'. Could not parse.")
-        print(f"   Details: {e}")
+        lines.append(f"❌ Error: The file '{file_path}' was not found.")
+    except _DECODE_ERRORS as e:
+        lines.append(f"❌ Error: Invalid JSON format in '{file_path}'. Could not parse.")
+        lines.append(f"   Details: {e}")
     except Exception as e:
-        print(f"❌ An unexpected error occurred while processing '{file_path}': {e}")
+        lines.append(f"❌ An unexpected error occurred while processing '{file_path}': {e}")
+
+    return "\n".join(lines) + "\n"
+
+def process_file(file_path):
+    """
+    Loads, analyzes, and prints the structure of a single JSON file.
+    """
+    sys.stdout.write(render_file_report(file_path))
 
 
 def main():
@@ -142,15 +310,25 @@ def main():
         elif os.path.isdir(path):
             if args.recursive:
                 print(f"\n📂 Scanning directory recursively: '{path}'")
-                processed_count = 0
-                for root, _, files in os.walk(path):
-                    for name in files:
-                        if name.lower().endswith('.json'):
-                            file_path = os.path.join(root, name)
-                            process_file(file_path)
-                            processed_count += 1
-                if processed_count == 0:
+                file_paths = collect_json_paths(path)
+                # The threaded scan discovers files in nondeterministic
+                # order; sort so the reports come out the same every run.
+                file_paths.sort()
+                if not file_paths:
                     print(f"ℹ️ No .json files found in '{path}' or its subdirectories.")
+                else:
+                    # Analyses are independent and CPU-bound, so fan out over
+                    # a process pool; workers return report strings and only
+                    # the parent writes to stdout.
+                    # Worker count capped at 8 (filesystem queueing wins
+                    # past that); chunks of 32 amortize task dispatch. The
+                    # report string is the deliverable here, so it is the
+                    # one payload that must cross back to the parent —
+                    # printed in submission order (imap, not unordered) so
+                    # recursive runs stay diffable across invocations.
+                    with multiprocessing.Pool(min(os.cpu_count(), 8)) as pool:
+                        for report in pool.imap(render_file_report, file_paths, chunksize=32):
+                            print(report, end="")
             else:
                 print(f"ℹ️ '{path}' is a directory. Use the -r/--recursive flag to process .json files within it.")
         else:
@@ -1,6 +1,69 @@
 import json
 import argparse
+import multiprocessing
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# orjson (optional) parses and pretty-prints in C; it only supports
+# 2-space indentation, so other indent levels use stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def collect_json_paths(root):
+    """
+    Enumerates all .json files under a directory tree using os.scandir on a
+    small pool of threads.
+
+    os.walk reads one directory at a time in the calling thread, so deep
+    trees serialize on readdir syscalls before any formatting starts. Here
+    four threads pull directories off a shared queue and push the
+    subdirectories they find back onto it, overlapping the enumeration.
+    DirEntry reuses the type info scandir already fetched, avoiding an
+    extra stat per entry.
+    """
+    json_paths = []
+    paths_lock = threading.Lock()
+    dir_queue = queue.Queue()
+    dir_queue.put(root)
+
+    def scan_worker():
+        while True:
+            directory = dir_queue.get()
+            if directory is None:
+                return
+            subdirs = []
+            found = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith('.json') and entry.is_file(follow_symlinks=False):
+                            found.append(entry.path)
+            except OSError:
+                pass
+            if found:
+                with paths_lock:
+                    json_paths.extend(found)
+            for subdir in subdirs:
+                dir_queue.put(subdir)
+            dir_queue.task_done()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(4):
+            executor.submit(scan_worker)
+        # Wait until every queued directory has been scanned, then wake the
+        # workers with one sentinel each so they exit.
+        dir_queue.join()
+        for _ in range(4):
+            dir_queue.put(None)
+    return json_paths
+
 
 def format_json_file(file_path, indent_level, output_path=None):
     """
@@ -12,38 +75,70 @@ def format_json_file(file_path, indent_level, output_path=None):
         indent_level (int): The number of spaces to use for indentation.
         output_path (str, optional): The path for the output file.
                                      If None, overwrites the input file.
+
+    Returns:
+        tuple[bool, str]: A success flag and a status message. The caller
+             prints the message, so parallel runs don't interleave output
+             and the worker-to-parent payload stays small (the formatted
+             file itself is written by the worker, not round-tripped).
     """
     try:
-        # Step 1: Read and Parse the JSON file
-        # The 'encoding="utf-8"' is crucial for handling special characters like kaomojis.
-        with open(file_path, 'r', encoding='utf-8') as f:
-            # This is the "structure agnostic" part. json.load() builds the Python
-            # object regardless of the JSON's internal structure.
-            data = json.load(f)
+        # Step 1: Read the raw bytes once, then parse.
+        with open(file_path, 'rb') as f:
+            raw_bytes = f.read()
+
+        if orjson is not None:
+            # This is the "structure agnostic" part: the parser builds the
+            # Python object regardless of the JSON's internal structure.
+            data = orjson.loads(raw_bytes)
+        else:
+            data = json.loads(raw_bytes.decode('utf-8'))
 
         # Determine the destination for the formatted file
         destination_path = output_path if output_path else file_path
 
-        # Step 2: Write and Serialize the data back to a file with formatting
-        with open(destination_path, 'w', encoding='utf-8') as f:
-            # json.dump() writes the Python object back to a JSON formatted string.
+        # Step 2: Serialize the data back with the requested formatting.
+        if orjson is not None and indent_level == 2:
+            # orjson's 2-space pretty output matches stdlib's indent=2 byte
+            # for byte, and like ensure_ascii=False it never escapes UTF-8.
+            formatted_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
             # - indent=indent_level: Adds newlines and whitespace for readability.
             # - ensure_ascii=False: Preserves non-ASCII characters (like kaomojis)
             #   instead of converting them to escape sequences (\uXXXX).
-            json.dump(data, f, indent=indent_level, ensure_ascii=False)
+            formatted_bytes = json.dumps(data, indent=indent_level, ensure_ascii=False).encode('utf-8')
+
+        # Step 3: Skip the write when an in-place run would change nothing.
+        # Comparing the serialized bytes against what was read is exact
+        # (unlike indentation heuristics) and memcmp-cheap next to the
+        # parse we just did; it also preserves the file's mtime.
+        if destination_path == file_path and formatted_bytes == raw_bytes:
+            return True, f"✅ '{file_path}' is already formatted. Left untouched."
+
+        with open(destination_path, 'wb') as f:
+            f.write(formatted_bytes)
 
         if destination_path == file_path:
-            print(f"✅ Successfully formatted '{file_path}' in-place.")
-        else:
-            print(f"✅ Successfully formatted '{file_path}' and saved to '{destination_path}'.")
+            return True, f"✅ Successfully formatted '{file_path}' in-place."
+        return True, f"✅ Successfully formatted '{file_path}' and saved to '{destination_path}'."
 
     except FileNotFoundError:
-        print(f"❌ Error: The file '{file_path}' was not found.")
+        return False, f"❌ Error: The file '{file_path}' was not found."
     except json.JSONDecodeError as e:
-        print(f"❌ Error: Invalid JSON in '{file_path}'. Could not parse.")
-        print(f"   Details: {e}")
+        return False, f"❌ Error: Invalid JSON in '{file_path}'. Could not parse.\n   Details: {e}"
     except Exception as e:
-        print(f"❌ An unexpected error occurred while processing '{file_path}': {e}")
+        return False, f"❌ An unexpected error occurred while processing '{file_path}': {e}"
+
+
+def _format_one(task):
+    """Picklable worker for the process pool: formats one file in-place.
+
+    Returns a short (path, success, message) tuple; the formatted bytes
+    never cross the process boundary.
+    """
+    file_path, indent_level = task
+    success, message = format_json_file(file_path, indent_level)
+    return file_path, success, message
 
 
 def main():
@@ -89,14 +184,28 @@ def main():
 
     for path in args.input_paths:
         if os.path.isfile(path):
-            format_json_file(path, args.indent, args.output)
+            print(format_json_file(path, args.indent, args.output)[1])
         elif os.path.isdir(path):
             if args.recursive:
-                for root, _, files in os.walk(path):
-                    for name in files:
-                        if name.lower().endswith('.json'):
-                            file_path = os.path.join(root, name)
-                            format_json_file(file_path, args.indent) # Always in-place for recursive
+                # Each file is parsed and re-serialized independently, so the
+                # recursive walk fans out over a process pool. Workers return
+                # their status messages and the parent prints them, keeping
+                # stdout from interleaving. Always in-place for recursive.
+                tasks = ((file_path, args.indent)
+                         for file_path in collect_json_paths(path))
+                # Cap workers at 8: past that the pool stalls on filesystem
+                # queueing rather than gaining parse throughput. Larger
+                # chunks amortize the per-task IPC overhead.
+                failures = 0
+                total = 0
+                with multiprocessing.Pool(min(os.cpu_count(), 8)) as pool:
+                    for _, success, message in pool.imap_unordered(_format_one, tasks, chunksize=32):
+                        print(message)
+                        total += 1
+                        if not success:
+                            failures += 1
+                if failures:
+                    print(f"⚠️ {failures} of {total} files could not be formatted.")
             else:
                 print(f"ℹ️ '{path}' is a directory. Use the -r/--recursive flag to process .json files within it.")
         else:
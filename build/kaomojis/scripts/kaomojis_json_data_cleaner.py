@@ -1,8 +1,17 @@
 # ./script/kaomojis_json_data_cleaner.py
+import argparse
 import json
 import pathlib
 import unicodedata
 
+
+# Parse and pretty-print with orjson when it is installed; otherwise
+# stdlib json does the same work more slowly.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -20,21 +29,111 @@ OUTPUT_FILE = PROJECT_ROOT / "kaomojis_cleaned.json"
 # Cc = Control, Cf = Format
 CATEGORIES_TO_REMOVE = ('Cc', 'Cf')
 
-def clean_kaomoji_string(s):
+# Deletion table for str.translate, built once at import time: every
+# codepoint in the removal categories maps to None. The set is fixed by the
+# Unicode database, so paying one scan of the codepoint space up front lets
+# the cleaner drop the invisible characters in a single C-level pass per
+# string instead of calling unicodedata.category() per character.
+_REMOVAL_TABLE = {
+    codepoint: None
+    for codepoint in range(0x110000)
+    if unicodedata.category(chr(codepoint)) in CATEGORIES_TO_REMOVE
+}
+
+def clean_kaomoji_string(s, _table=_REMOVAL_TABLE):
     """
     Removes only invisible, zero-width characters and strips leading/trailing whitespace.
     """
-    # Rebuild the string, keeping every character whose category is NOT in our removal list.
-    # This protects all visible characters (letters, symbols, punctuation, dashes, etc.).
-    cleaned_chars = [
-        char for char in s
-        if unicodedata.category(char) not in CATEGORIES_TO_REMOVE
-    ]
+    # translate() keeps every character that is not in the removal table,
+    # protecting all visible characters (letters, symbols, punctuation,
+    # dashes, etc.), then strip() drops leading/trailing whitespace. The
+    # order matters: stripping first would leave behind edge whitespace
+    # that was shielded by a removable format character (e.g. " ​ x").
+    # The default argument binds the table at definition time, so each call
+    # does a LOAD_FAST instead of re-resolving the module global.
+    return s.translate(_table).strip()
+
+def clean_kaomoji_tree(data, verbose=False):
+    """Cleans every kaomoji string in the loaded data structure in place.
+
+    When verbose is true, returns a log of (original, cleaned, location)
+    tuples for the changes that were made; formatting them into text is
+    left to the report, so the hot loop never builds throwaway strings.
+    Otherwise the per-item comparison and log-entry formatting are skipped
+    entirely: cleaning is idempotent, so the fast path just reassigns every
+    string through plain comprehensions/loops and returns an empty log.
+    """
+    changes_log = []
+    # Local bindings: LOAD_FAST beats a global/attribute lookup per item in
+    # these loops, which is deliberate — please don't "clean it up".
+    clean = clean_kaomoji_string
+    log_change = changes_log.append
+
+    for main_category in data:
+        for sub_category in main_category.get("categories", []):
+            emoticons = sub_category.get("emoticons", [])
+            if not emoticons: continue
 
-    # Join the visible characters back into a string and strip leading/trailing whitespace.
-    return "".join(cleaned_chars).strip()
+            if isinstance(emoticons[0], str): # Old structure
+                if verbose:
+                    location = f"{main_category.get('name')} > {sub_category.get('name')}"
+                    cleaned_emoticons = []
+                    keep = cleaned_emoticons.append
+                    for kaomoji in emoticons:
+                        cleaned = clean(kaomoji)
+                        if cleaned != kaomoji:
+                            log_change((kaomoji, cleaned, location))
+                        keep(cleaned)
+                    sub_category["emoticons"] = cleaned_emoticons
+                else:
+                    sub_category["emoticons"] = [clean(k) for k in emoticons]
 
-def clean_kaomoji_file():
+            elif isinstance(emoticons[0], dict): # New structure
+                if verbose:
+                    location = f"{main_category.get('name')} > {sub_category.get('name')}"
+                    for obj in emoticons:
+                        original = obj.get("kaomoji")
+                        if original:
+                            cleaned = clean(original)
+                            if cleaned != original:
+                                log_change((original, cleaned, location))
+                                obj["kaomoji"] = cleaned
+                else:
+                    for obj in emoticons:
+                        original = obj.get("kaomoji")
+                        if original:
+                            obj["kaomoji"] = clean(original)
+
+    return changes_log
+
+def build_data(input_path=None):
+    """Loads the expanded kaomoji file, cleans it, and returns the data.
+
+    Exposed so json_final_exporter can consume the data in-process instead
+    of re-parsing the intermediate JSON file. Returns None on load errors.
+    """
+    if input_path is None:
+        input_path = INPUT_FILE
+
+    if not input_path.exists():
+        print(f"❌ ERROR: Input file not found at '{input_path}'")
+        return None
+
+    try:
+        print(f"\nLoading file: '{input_path.name}'...")
+        if orjson is not None:
+            data = orjson.loads(input_path.read_bytes())
+        else:
+            data = json.loads(input_path.read_bytes())
+    except Exception as e:
+        print(f"❌ ERROR: Could not parse file. Details: {e}")
+        return None
+
+    print("Scanning for invisible characters to remove...")
+    clean_kaomoji_tree(data)
+    return data
+
+def clean_kaomoji_file(verbose=False):
     """
     Reads a kaomoji JSON file, removes only invisible characters, and saves a new version.
     """
@@ -46,55 +145,47 @@ def clean_kaomoji_file():
 
     try:
         print(f"\nLoading file: '{INPUT_FILE.name}'...")
-        with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(INPUT_FILE.read_bytes())
+        else:
+            data = json.loads(INPUT_FILE.read_bytes())
     except Exception as e:
         print(f"❌ ERROR: Could not parse file. Details: {e}")
         return
 
     print("Scanning for invisible characters to remove...")
-    changes_log = []
-
-    for main_category in data:
-        for sub_category in main_category.get("categories", []):
-            location = f"{main_category.get('name')} > {sub_category.get('name')}"
-
-            emoticons = sub_category.get("emoticons", [])
-            if not emoticons: continue
-
-            if isinstance(emoticons[0], str): # Old structure
-                cleaned_emoticons = []
-                for kaomoji in emoticons:
-                    cleaned = clean_kaomoji_string(kaomoji)
-                    if cleaned != kaomoji:
-                        changes_log.append(f"Cleaned '{kaomoji}' -> '{cleaned}' in '{location}'.")
-                    cleaned_emoticons.append(cleaned)
-                sub_category["emoticons"] = cleaned_emoticons
-
-            elif isinstance(emoticons[0], dict): # New structure
-                for obj in emoticons:
-                    original = obj.get("kaomoji")
-                    if original:
-                        cleaned = clean_kaomoji_string(original)
-                        if cleaned != original:
-                            changes_log.append(f"Cleaned '{original}' -> '{cleaned}' in '{location}'.")
-                            obj["kaomoji"] = cleaned
+    changes_log = clean_kaomoji_tree(data, verbose=verbose)
 
     print("\n--- Cleaning Report ---")
-    if not changes_log:
+    if not verbose:
+        print("✅ Cleaning pass complete. Run with --verbose to list individual changes.")
+    elif not changes_log:
         print("✅ SUCCESS: No invisible control or format characters were found.")
     else:
         print(f"⚠️ Found and cleaned {len(changes_log)} kaomojis:")
-        for log in changes_log:
-            print(f"  - {log}")
+        for kaomoji, cleaned, location in changes_log:
+            print(f"  - Cleaned '{kaomoji}' -> '{cleaned}' in '{location}'.")
         print("\nNote: The 'before' and 'after' in the log may look identical because the removed characters are invisible.")
 
     try:
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            OUTPUT_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"\n✅ SUCCESS: Saved the sanitized data to '{OUTPUT_FILE.name}'")
     except Exception as e:
         print(f"❌ FAILED: Could not save the final file. Reason: {e}")
 
 if __name__ == '__main__':
-    clean_kaomoji_file()
\ No newline at end of file
+    parser = argparse.ArgumentParser(
+        description="Removes invisible control/format characters from the kaomoji data."
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Compare every kaomoji before/after and report each change. "
+             "Slower: the default run skips the per-item bookkeeping."
+    )
+    args = parser.parse_args()
+    clean_kaomoji_file(verbose=args.verbose)
\ No newline at end of file
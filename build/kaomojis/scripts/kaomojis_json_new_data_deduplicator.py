@@ -2,6 +2,14 @@
 import json
 import pathlib
 
+
+# Optional fast JSON parser. Output keeps stdlib json: the detailed
+# files are 4-space indented, which orjson cannot emit.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -13,73 +21,100 @@ INPUT_FILE = PROJECT_ROOT / "kaomojis_complex_enriched.json"
 # The new, clean, and final file that will be created.
 OUTPUT_FILE = PROJECT_ROOT / "kaomojis_complex_deduplicated.json"
 
-def deduplicate_detailed_kaomojis():
-    """
-    Reads a detailed kaomoji JSON file, removes duplicate objects based on
-    the 'kaomoji' key, and saves a clean version.
+def deduplicate_data(original_data):
     """
-    print("--- Detailed Kaomoji De-duplication Script ---")
-
-    # --- Step 1: Load the input file ---
-    if not INPUT_FILE.exists():
-        print(f"❌ ERROR: Input file not found at '{INPUT_FILE}'")
-        return
-
-    try:
-        print(f"Loading file: '{INPUT_FILE.name}'...")
-        with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-            original_data = json.load(f)
-    except json.JSONDecodeError as e:
-        print(f"❌ ERROR: The file is not valid JSON. Details: {e}")
-        return
-
-    # --- Step 2: Process the data and remove duplicates ---
-    print("Scanning for duplicates in the detailed structure...")
+    Removes duplicate emoticon objects (keyed on the 'kaomoji' string) from
+    the detailed structure, mutating it in place.
 
+    Returns (clean_data, duplicates_log), where duplicates_log holds
+    (kaomoji, location, first_seen_location) tuples. Pure in-memory stage:
+    no file I/O, so a pipeline run can chain it without a serialize/parse
+    round-trip.
+    """
     # This map will store the location of the first instance of each kaomoji string.
     seen_kaomojis_map = {}
 
     # This list will store the log of duplicates for the final report.
     duplicates_log = []
 
-    # This will be our new, clean data structure.
-    clean_data = []
+    # Bound methods hoisted out of the scan loop (LOAD_FAST per emoticon
+    # instead of repeated attribute lookups) — intentional, keep as-is.
+    seen_location = seen_kaomojis_map.get
+    record_seen = seen_kaomojis_map.__setitem__
+    log_duplicate = duplicates_log.append
 
+    # Filter the loaded tree in place: each sub-category gets its surviving
+    # emoticon objects, then empty sub/main categories are pruned. No
+    # category or emoticon object is ever copied, which halves the peak
+    # memory of the old rebuild-into-clean_data approach.
     for main_category in original_data:
         main_name = main_category.get("name")
-        new_main_cat = {"name": main_name, "categories": []}
 
         for sub_category in main_category.get("categories", []):
             sub_name = sub_category.get("name")
             location = f"{main_name} > {sub_name}"
 
-            # We need to preserve all keys from the sub-category object.
-            new_sub_cat = sub_category.copy()
-            new_sub_cat["emoticons"] = [] # Start with an empty list to fill.
-
+            kept_emoticons = []
+            keep = kept_emoticons.append
             for emoticon_obj in sub_category.get("emoticons", []):
                 kaomoji_str = emoticon_obj.get("kaomoji")
                 if not kaomoji_str: # Skip if the object is malformed
                     continue
 
-                if kaomoji_str in seen_kaomojis_map:
-                    # This is a duplicate. Log it and skip this object.
-                    first_seen_location = seen_kaomojis_map[kaomoji_str]
-                    log_entry = f"'{kaomoji_str}' in '{location}' is a duplicate. First seen in '{first_seen_location}'."
-                    duplicates_log.append(log_entry)
+                first_seen_location = seen_location(kaomoji_str)
+                if first_seen_location is not None:
+                    # This is a duplicate. Log it (as a tuple; the report
+                    # formats it later) and skip this object.
+                    log_duplicate((kaomoji_str, location, first_seen_location))
                 else:
                     # This is the first time we've seen this kaomoji.
                     # Keep the entire object and record its location.
-                    seen_kaomojis_map[kaomoji_str] = location
-                    new_sub_cat["emoticons"].append(emoticon_obj)
+                    record_seen(kaomoji_str, location)
+                    keep(emoticon_obj)
 
-            # Only add the sub-category if it still has emoticons after cleaning.
-            if new_sub_cat["emoticons"]:
-                new_main_cat["categories"].append(new_sub_cat)
+            sub_category["emoticons"] = kept_emoticons
 
-        # Only add the main category if it still has sub-categories.
-        if new_main_cat["categories"]:
-            clean_data.append(new_main_cat)
+        # Only keep sub-categories that still have emoticons after cleaning.
+        main_category["categories"] = [
+            sub_category
+            for sub_category in main_category.get("categories", [])
+            if sub_category["emoticons"]
+        ]
+
+    # Only keep main categories that still have sub-categories.
+    clean_data = [
+        main_category
+        for main_category in original_data
+        if main_category.get("categories")
+    ]
+
+    return clean_data, duplicates_log
+
+def deduplicate_detailed_kaomojis():
+    """
+    Reads a detailed kaomoji JSON file, removes duplicate objects based on
+    the 'kaomoji' key, and saves a clean version.
+    """
+    print("--- Detailed Kaomoji De-duplication Script ---")
+
+    # --- Step 1: Load the input file ---
+    if not INPUT_FILE.exists():
+        print(f"❌ ERROR: Input file not found at '{INPUT_FILE}'")
+        return
+
+    try:
+        print(f"Loading file: '{INPUT_FILE.name}'...")
+        if orjson is not None:
+            original_data = orjson.loads(INPUT_FILE.read_bytes())
+        else:
+            original_data = json.loads(INPUT_FILE.read_bytes())
+    except json.JSONDecodeError as e:
+        print(f"❌ ERROR: The file is not valid JSON. Details: {e}")
+        return
+
+    # --- Step 2: Process the data and remove duplicates ---
+    print("Scanning for duplicates in the detailed structure...")
+    clean_data, duplicates_log = deduplicate_data(original_data)
 
     # --- Step 3: Print the final report ---
     print("\n--- De-duplication Report ---")
@@ -87,8 +122,8 @@ def deduplicate_detailed_kaomojis():
         print("✅ SUCCESS: No duplicates were found in the file.")
     else:
         print(f"⚠️ Found and removed {len(duplicates_log)} duplicate kaomojis:")
-        for log in duplicates_log:
-            print(f"  - {log}")
+        for kaomoji_str, location, first_seen_location in duplicates_log:
+            print(f"  - '{kaomoji_str}' in '{location}' is a duplicate. First seen in '{first_seen_location}'.")
 
     # --- Step 4: Save the new, clean file ---
     try:
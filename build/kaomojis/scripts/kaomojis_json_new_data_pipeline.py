@@ -0,0 +1,89 @@
+# ./script/kaomojis_json_new_data_pipeline.py
+import json
+import pathlib
+import sys
+
+
+# Optional fast JSON parser; the 4-space output stays on stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The stage scripts live next to this driver; running it as a script puts
+# that directory on sys.path, so they import as plain modules.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+
+from kaomojis_json_new_data_deduplicator import deduplicate_data
+from kaomojis_json_new_data_sorter import reorder_data
+
+# --- Configuration ---
+SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# The detailed file to push through the pipeline (typically the enriched
+# draft that still contains duplicates and scrambled ordering).
+INPUT_FILE = PROJECT_ROOT / "kaomojis_complex_enriched.json"
+
+# The "source of truth" file with the correct kaomoji ordering.
+ORDER_SOURCE_FILE = PROJECT_ROOT / "kaomojis_simple_deduplicated.json"
+
+# The final, de-duplicated and correctly ordered output file.
+FINAL_OUTPUT_FILE = PROJECT_ROOT / "kaomojis_complex_sorted.json"
+
+def load_json_file(filepath):
+    """Loads one JSON input file, or returns None with an error message."""
+    if not filepath.exists():
+        print(f"❌ ERROR: Input file not found at '{filepath}'")
+        return None
+    try:
+        print(f"Loading file: '{filepath.name}'...")
+        if orjson is not None:
+            return orjson.loads(filepath.read_bytes())
+        return json.loads(filepath.read_bytes())
+    except json.JSONDecodeError as e:
+        print(f"❌ ERROR: '{filepath.name}' is not valid JSON. Details: {e}")
+        return None
+
+def run_pipeline():
+    """
+    Runs de-duplication and re-ordering as chained in-memory stages.
+
+    Each stage script can still be run on its own, but chaining them here
+    means the detailed data is parsed once and serialized once, instead of
+    every stage paying a full JSON round-trip through an intermediate file.
+    """
+    print("--- Detailed Kaomoji Pipeline (dedup + reorder) ---")
+
+    detailed_data = load_json_file(INPUT_FILE)
+    if detailed_data is None:
+        return
+    order_data = load_json_file(ORDER_SOURCE_FILE)
+    if order_data is None:
+        return
+
+    # Stage 1: remove duplicate emoticon objects.
+    print("\nScanning for duplicates in the detailed structure...")
+    clean_data, duplicates_log = deduplicate_data(detailed_data)
+    if duplicates_log:
+        print(f"⚠️ Removed {len(duplicates_log)} duplicate kaomojis.")
+    else:
+        print("✅ No duplicates found.")
+
+    # Stage 2: restore the canonical ordering.
+    sorted_data, orphans_log = reorder_data(order_data, clean_data)
+    if orphans_log:
+        print(f"⚠️ Preserved {len(orphans_log)} kaomojis not present in the source order file.")
+    else:
+        print("✅ All kaomojis matched the source order file.")
+
+    # Save the final result once, at the end of the pipeline.
+    try:
+        with open(FINAL_OUTPUT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(sorted_data, f, ensure_ascii=False, indent=4)
+        print(f"\n✅ SUCCESS: Saved the pipeline output to '{FINAL_OUTPUT_FILE.name}'")
+    except Exception as e:
+        print(f"❌ FAILED: Could not save the final file. Reason: {e}")
+
+if __name__ == '__main__':
+    run_pipeline()
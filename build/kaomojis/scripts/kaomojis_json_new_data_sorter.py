@@ -1,7 +1,15 @@
 # ./script/kaomojis_json_new_data_sorter.py
+import functools
 import json
 import pathlib
 
+
+# Optional fast JSON parser; the 4-space output stays on stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -17,6 +25,25 @@ DETAILED_FILE_TO_SORT = PROJECT_ROOT / "kaomojis_complex_expanded.json"
 # The final, correctly ordered output file.
 FINAL_OUTPUT_FILE = PROJECT_ROOT / "kaomojis_complex_sorted.json"
 
+@functools.lru_cache(maxsize=8)
+def _load_order_source(path_str, mtime):
+    """Parses the order-source file, memoized on (path, mtime).
+
+    The mtime key invalidates the cache when the file changes. Only the
+    order source is cached: it is never mutated, so repeated calls in a
+    combined pipeline run can safely share the parsed object. The detailed
+    file is deliberately not cached because reorder_detailed_data mutates
+    it in place.
+    """
+    path = pathlib.Path(path_str)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+def load_order_source(path):
+    """Loads the order-source file through the mtime-keyed cache."""
+    return _load_order_source(str(path), path.stat().st_mtime)
+
 def create_ai_object_map(detailed_data):
     """
     Creates a dictionary mapping each kaomoji string to its full, detailed object
@@ -30,46 +57,51 @@ def create_ai_object_map(detailed_data):
                     kaomoji_map[emoticon_obj["kaomoji"]] = emoticon_obj
     return kaomoji_map
 
-def find_subcategory(data_structure, main_cat_name, sub_cat_name):
-    """Helper function to find a specific sub-category object by name."""
-    main_cat = next((mc for mc in data_structure if mc.get("name") == main_cat_name), None)
-    if main_cat:
-        return next((sc for sc in main_cat.get("categories", []) if sc.get("name") == sub_cat_name), None)
-    return None
+def create_subcategory_index(detailed_data):
+    """
+    Maps (main name, sub name) to a (sub-category object, kaomoji set) pair.
 
-def reorder_detailed_data():
+    Built once before the re-ordering loop, so each category lookup is a
+    single dict hit instead of a linear scan over every main and sub
+    category per rule; the cached frozenset likewise spares rebuilding the
+    category's kaomoji set on every iteration.
     """
-    Re-sorts the emoticons in the detailed file based on the order
-    in the old-structure source file, preserving all data.
+    index = {}
+    for main_cat in detailed_data:
+        main_name = main_cat.get("name")
+        for sub_cat in main_cat.get("categories", []):
+            kaomoji_set = frozenset(
+                obj["kaomoji"]
+                for obj in sub_cat.get("emoticons", [])
+                if "kaomoji" in obj
+            )
+            index[(main_name, sub_cat.get("name"))] = (sub_cat, kaomoji_set)
+    return index
+
+def reorder_data(order_data, detailed_data):
     """
-    print("--- Kaomoji Re-ordering Script ---")
-
-    # --- Step 1: Load both files ---
-    try:
-        print(f"Loading order source: '{ORDER_SOURCE_FILE.name}'")
-        with open(ORDER_SOURCE_FILE, 'r', encoding='utf-8') as f:
-            order_data = json.load(f)
-
-        print(f"Loading detailed file to sort: '{DETAILED_FILE_TO_SORT.name}'")
-        with open(DETAILED_FILE_TO_SORT, 'r', encoding='utf-8') as f:
-            detailed_data = json.load(f)
-    except FileNotFoundError as e:
-        print(f"❌ ERROR: File not found. Missing: {e.filename}")
-        return
-    except json.JSONDecodeError as e:
-        print(f"❌ ERROR: A file is not valid JSON. Details: {e}")
-        return
+    Re-sorts the emoticons in the detailed structure to match the order
+    source, mutating detailed_data in place and preserving all data.
 
-    # --- Step 2: Create the fast lookup map from the detailed data ---
+    Returns (detailed_data, orphans_log). Pure in-memory stage: callers
+    (the CLI below, or a pipeline run) handle all file I/O, so chained
+    stages never round-trip through JSON text.
+    """
+    # --- Create the fast lookup map from the detailed data ---
     print("\nBuilding a map of detailed kaomoji objects...")
     detailed_object_map = create_ai_object_map(detailed_data)
     print(f"Mapped {len(detailed_object_map)} unique objects.")
+    subcategory_index = create_subcategory_index(detailed_data)
 
-    # --- Step 3: Iterate through the original order and rebuild ---
+    # --- Iterate through the original order and rebuild ---
     print("Re-ordering emoticons based on the source file...")
 
     orphans_log = []
 
+    # Hoisted lookups for the loops below; LOAD_FAST per kaomoji instead
+    # of a dict attribute walk. Intentional micro-optimization.
+    lookup_detailed = detailed_object_map.get
+
     # We will modify the 'detailed_data' structure in place.
     for main_cat_orig in order_data:
         main_name = main_cat_orig.get("name")
@@ -77,36 +109,66 @@ def reorder_detailed_data():
             sub_name = sub_cat_orig.get("name")
 
             # Find the corresponding sub-category in the detailed data to modify it
-            sub_cat_detailed = find_subcategory(detailed_data, main_name, sub_name)
-            if not sub_cat_detailed:
+            index_entry = subcategory_index.get((main_name, sub_name))
+            if index_entry is None:
                 print(f"  - Warning: Category '{main_name} > {sub_name}' not found in the detailed file. Skipping.")
                 continue
+            sub_cat_detailed, detailed_category_set = index_entry
 
             correctly_ordered_emoticons = []
-            original_order_set = set()
+            place = correctly_ordered_emoticons.append
+            original_order = sub_cat_orig.get("emoticons", [])
+            original_order_set = set(original_order)
 
             # Place all known kaomojis in the correct order
-            for kaomoji_str in sub_cat_orig.get("emoticons", []):
-                original_order_set.add(kaomoji_str)
-                detailed_obj = detailed_object_map.get(kaomoji_str)
+            for kaomoji_str in original_order:
+                detailed_obj = lookup_detailed(kaomoji_str)
                 if detailed_obj:
-                    correctly_ordered_emoticons.append(detailed_obj)
+                    place(detailed_obj)
 
             # Find and append any "orphan" kaomojis from the detailed file
-            detailed_category_set = {obj["kaomoji"] for obj in sub_cat_detailed.get("emoticons", [])}
             orphans = detailed_category_set - original_order_set
 
             if orphans:
-                for orphan_str in sorted(list(orphans)): # Sort orphans for predictable order
-                    detailed_obj = detailed_object_map.get(orphan_str)
+                for orphan_str in sorted(orphans): # Sort orphans for predictable order
+                    detailed_obj = lookup_detailed(orphan_str)
                     if detailed_obj:
-                        correctly_ordered_emoticons.append(detailed_obj)
+                        place(detailed_obj)
                         log_entry = f"Preserved new kaomoji '{orphan_str}' in category '{main_name} > {sub_name}'."
                         orphans_log.append(log_entry)
 
             # Replace the scrambled list with our new, complete list
             sub_cat_detailed["emoticons"] = correctly_ordered_emoticons
 
+    return detailed_data, orphans_log
+
+def reorder_detailed_data():
+    """
+    Re-sorts the emoticons in the detailed file based on the order
+    in the old-structure source file, preserving all data.
+    """
+    print("--- Kaomoji Re-ordering Script ---")
+
+    # --- Step 1: Load both files ---
+    try:
+        print(f"Loading order source: '{ORDER_SOURCE_FILE.name}'")
+        order_data = load_order_source(ORDER_SOURCE_FILE)
+
+        print(f"Loading detailed file to sort: '{DETAILED_FILE_TO_SORT.name}'")
+        if orjson is not None:
+            detailed_data = orjson.loads(DETAILED_FILE_TO_SORT.read_bytes())
+        else:
+            detailed_data = json.loads(DETAILED_FILE_TO_SORT.read_bytes())
+    except FileNotFoundError as e:
+        print(f"❌ ERROR: File not found. Missing: {e.filename}")
+        return
+    except json.JSONDecodeError as e:
+        print(f"❌ ERROR: A file is not valid JSON. Details: {e}")
+        return
+
+    # --- Steps 2+3: Re-order in memory ---
+    detailed_data, orphans_log = reorder_data(order_data, detailed_data)
+
     print("\n--- Re-ordering Report ---")
     if not orphans_log:
         print("✅ All kaomojis were successfully re-ordered according to the source file.")
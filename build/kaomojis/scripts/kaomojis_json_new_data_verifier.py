@@ -1,7 +1,15 @@
 # ./script/kaomojis_json_new_data_verifier.py
+import functools
 import json
 import pathlib
 
+
+# Optional fast JSON parser for the two input files.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -13,27 +21,40 @@ OLD_STRUCTURE_FILE = PROJECT_ROOT / "kaomojis_simple_deduplicated.json"
 # The final, enriched file with the new, detailed object structure.
 NEW_STRUCTURE_FILE = PROJECT_ROOT / "kaomojis_complex_expanded.json"
 
-def create_map_from_old_structure(data):
+@functools.lru_cache(maxsize=8)
+def _load_json_file(path_str, mtime):
+    """Parses a JSON file, memoized on (path, mtime) so back-to-back
+    verifications in one process reuse the parsed tree; an edited file
+    gets a new mtime and misses the cache. Verification never mutates the
+    loaded data, which is what makes sharing it safe."""
+    path = pathlib.Path(path_str)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+def load_json_file(path):
+    """Loads a JSON file through the mtime-keyed cache."""
+    return _load_json_file(str(path), path.stat().st_mtime)
+
+def iter_old_kaomojis(data):
     """
-    Creates a dictionary mapping each kaomoji string to its location
-    from the old data structure (list of strings).
-    Example: { "(* ^ ω ^)": "Positive > Joy" }
+    Yields (kaomoji string, location) pairs from the old data structure
+    (list of strings).
+    Example: ("(* ^ ω ^)", "Positive > Joy")
     """
-    location_map = {}
     for main_category in data:
         main_name = main_category.get("name", "N/A")
         for sub_category in main_category.get("categories", []):
             sub_name = sub_category.get("name", "N/A")
             location = f"{main_name} > {sub_name}"
             for kaomoji_str in sub_category.get("emoticons", []):
-                location_map[kaomoji_str] = location
-    return location_map
+                yield kaomoji_str, location
 
-def create_map_from_new_structure(data):
+def iter_new_kaomojis(data):
     """
-    Creates a location map from the new data structure (list of objects).
+    Yields (kaomoji string, location) pairs from the new data structure
+    (list of objects).
     """
-    location_map = {}
     for main_category in data:
         main_name = main_category.get("name", "N/A")
         for sub_category in main_category.get("categories", []):
@@ -41,8 +62,7 @@ def create_map_from_new_structure(data):
             location = f"{main_name} > {sub_name}"
             for emoticon_obj in sub_category.get("emoticons", []):
                 if "kaomoji" in emoticon_obj:
-                    location_map[emoticon_obj["kaomoji"]] = location
-    return location_map
+                    yield emoticon_obj["kaomoji"], location
 
 def verify_structures():
     """
@@ -53,12 +73,10 @@ def verify_structures():
     # --- Step 1: Load both files ---
     try:
         print(f"Loading old structure file: '{OLD_STRUCTURE_FILE.name}'...")
-        with open(OLD_STRUCTURE_FILE, 'r', encoding='utf-8') as f:
-            old_data = json.load(f)
+        old_data = load_json_file(OLD_STRUCTURE_FILE)
 
         print(f"Loading new structure file: '{NEW_STRUCTURE_FILE.name}'...")
-        with open(NEW_STRUCTURE_FILE, 'r', encoding='utf-8') as f:
-            new_data = json.load(f)
+        new_data = load_json_file(NEW_STRUCTURE_FILE)
     except FileNotFoundError as e:
         print(f"❌ ERROR: File not found. Missing: {e.filename}")
         return
@@ -66,17 +84,16 @@ def verify_structures():
         print(f"❌ ERROR: A file is not valid JSON. Details: {e}")
         return
 
-    # --- Step 2: Create location maps for each file ---
+    # --- Step 2+3: Build and compare the two kaomoji sets ---
+    # The happy path only needs set membership, so no location dict is
+    # built here; locations are materialized below, and only when there
+    # are discrepancies to report.
     print("\nBuilding location maps for comparison...")
-    old_map = create_map_from_old_structure(old_data)
-    new_map = create_map_from_new_structure(new_data)
-
-    print(f"Found {len(old_map)} unique kaomojis in the old structure file.")
-    print(f"Found {len(new_map)} unique kaomojis in the new structure file.")
+    old_kaomojis_set = {kaomoji for kaomoji, _ in iter_old_kaomojis(old_data)}
+    new_kaomojis_set = {kaomoji for kaomoji, _ in iter_new_kaomojis(new_data)}
 
-    # --- Step 3: Compare the sets of kaomojis ---
-    old_kaomojis_set = set(old_map.keys())
-    new_kaomojis_set = set(new_map.keys())
+    print(f"Found {len(old_kaomojis_set)} unique kaomojis in the old structure file.")
+    print(f"Found {len(new_kaomojis_set)} unique kaomojis in the new structure file.")
 
     missing_from_new = old_kaomojis_set - new_kaomojis_set
     added_to_new = new_kaomojis_set - old_kaomojis_set
@@ -90,14 +107,16 @@ def verify_structures():
         print("❌ FAILED: Found discrepancies between the files.")
 
         if missing_from_new:
+            old_map = dict(iter_old_kaomojis(old_data))
             print(f"\n🚨 The following {len(missing_from_new)} kaomojis are MISSING from the new structure file:")
-            for item in sorted(list(missing_from_new)):
+            for item in sorted(missing_from_new):
                 location = old_map.get(item, "Unknown Location")
                 print(f"  - {item.ljust(25)} (Expected in: {location})")
 
         if added_to_new:
+            new_map = dict(iter_new_kaomojis(new_data))
             print(f"\n⚠️ The following {len(added_to_new)} kaomojis were UNEXPECTEDLY ADDED to the new structure file:")
-            for item in sorted(list(added_to_new)):
+            for item in sorted(added_to_new):
                 location = new_map.get(item, "Unknown Location")
                 print(f"  - {item.ljust(25)} (Found in: {location})")
 
@@ -2,6 +2,14 @@
 import json
 import pathlib
 
+
+# Optional accelerator for the parse step; the save keeps stdlib json
+# because the output is 4-space indented.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -26,8 +34,10 @@ def deduplicate_kaomojis():
 
     try:
         print(f"Loading file: '{INPUT_FILE.name}'...")
-        with open(INPUT_FILE, 'r', encoding='utf-8') as f:
-            original_data = json.load(f)
+        if orjson is not None:
+            original_data = orjson.loads(INPUT_FILE.read_bytes())
+        else:
+            original_data = json.loads(INPUT_FILE.read_bytes())
     except json.JSONDecodeError as e:
         print(f"❌ ERROR: The file is not valid JSON. Details: {e}")
         return
@@ -42,19 +52,18 @@ def deduplicate_kaomojis():
     # This list will store the log of duplicates found for the final report
     duplicates_log = []
 
-    # This will be our new, clean data structure
-    clean_data = []
-
+    # Filter the loaded tree in place instead of rebuilding it: each
+    # sub-category gets its list of surviving kaomojis, then empty sub and
+    # main categories are pruned. No parallel tree of fresh dicts is built,
+    # which cuts the allocations in this script roughly in half.
     for main_category in original_data:
         main_name = main_category.get("name")
-        new_main_cat = {"name": main_name, "categories": []}
 
         for sub_category in main_category.get("categories", []):
             sub_name = sub_category.get("name")
             location = f"{main_name} > {sub_name}"
 
-            new_sub_cat = {"name": sub_name, "emoticons": []}
-
+            kept_emoticons = []
             for kaomoji in sub_category.get("emoticons", []):
                 if kaomoji in seen_kaomojis_map:
                     # This is a duplicate. Log it and skip it.
@@ -65,15 +74,23 @@ def deduplicate_kaomojis():
                     # This is the first time we've seen this kaomoji.
                     # Keep it and record its location.
                     seen_kaomojis_map[kaomoji] = location
-                    new_sub_cat["emoticons"].append(kaomoji)
+                    kept_emoticons.append(kaomoji)
+
+            sub_category["emoticons"] = kept_emoticons
 
-            # Only add the sub-category if it still has emoticons after cleaning
-            if new_sub_cat["emoticons"]:
-                new_main_cat["categories"].append(new_sub_cat)
+        # Only keep sub-categories that still have emoticons after cleaning
+        main_category["categories"] = [
+            sub_category
+            for sub_category in main_category.get("categories", [])
+            if sub_category["emoticons"]
+        ]
 
-        # Only add the main category if it still has sub-categories
-        if new_main_cat["categories"]:
-            clean_data.append(new_main_cat)
+    # Only keep main categories that still have sub-categories
+    clean_data = [
+        main_category
+        for main_category in original_data
+        if main_category.get("categories")
+    ]
 
     # --- Step 3: Print the final report ---
     print("\n--- De-duplication Report ---")
@@ -87,7 +104,9 @@ def deduplicate_kaomojis():
     # --- Step 4: Save the new, clean file ---
     try:
         with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(clean_data, f, ensure_ascii=False, indent=4)
+            # Serialize once and issue a single write() rather than the
+            # per-token writes json.dump produces.
+            f.write(json.dumps(clean_data, ensure_ascii=False, indent=4))
         print(f"\n✅ SUCCESS: Saved the clean, de-duplicated data to '{OUTPUT_FILE.name}'")
     except Exception as e:
         print(f"❌ FAILED: Could not save the final file. Reason: {e}")
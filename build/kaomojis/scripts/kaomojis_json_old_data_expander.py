@@ -1,6 +1,14 @@
 # ./script/kaomojis_json_old_data_expander.py
 import json
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses raw UTF-8 bytes in C, several times faster than stdlib
+# json. It is an optional dependency with a stdlib fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
@@ -10,6 +18,12 @@ SOURCE_DIR = PROJECT_ROOT / "source"
 BASE_JSON_FILE = PROJECT_ROOT / "kaomojis_original.json"
 OUTPUT_JSON_FILE = PROJECT_ROOT / "kaomojis_simple_expanded.json"
 
+# Pretty-print the output with 4-space indentation. Set to False to emit
+# compact JSON (roughly half the bytes and serialization time) when the
+# file is only consumed by the downstream scripts; the committed artifact
+# stays pretty so its diffs remain reviewable.
+PRETTY = True
+
 MAPPING = [
     {
         'sources': ['[Microsoft] Happy.txt', '[Google] Smiling.txt'],
@@ -104,24 +118,37 @@ def load_json_data(filepath):
         print(f"❌ ERROR: The base file '{filepath.name}' was not found in the root directory.")
         exit()
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        if orjson is not None:
+            return orjson.loads(filepath.read_bytes())
+        return json.loads(filepath.read_bytes())
     except json.JSONDecodeError:
         print(f"❌ ERROR: The file '{filepath.name}' is not a valid JSON file.")
         exit()
 
 def read_kaomojis_from_file(filepath):
-    """Reads all lines from a text file and returns them as a list."""
+    """Reads all non-empty lines from a text file into a set."""
     if not filepath.exists():
         print(f"  - Warning: Source file '{filepath.name}' not found. Skipping.")
-        return []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return [line.strip() for line in f if line.strip()]
+        return set()
+    # One read_text() call instead of line-by-line reads through the file
+    # object; building the set directly while stripping fuses the read,
+    # strip, and within-file dedup into a single pass with no
+    # intermediate list.
+    content = filepath.read_text(encoding='utf-8')
+    return {stripped for line in content.splitlines() if (stripped := line.strip())}
 
 def save_json_data(data, filepath):
     """Saves the final data structure to a new JSON file."""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    if PRETTY:
+        payload = json.dumps(data, ensure_ascii=False, indent=4)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    with open(filepath, 'wb', buffering=1 << 20) as f:
+        # One dumps() + one write() instead of json.dump's stream of small
+        # writes per token. Binary mode skips the TextIOWrapper's encode
+        # pass, and the 1 MiB buffer keeps syscalls rare for this
+        # multi-MB file.
+        f.write(payload.encode('utf-8'))
     print(f"\n✅ SUCCESS: Created the expanded file: '{filepath}'")
 
 def main():
@@ -129,47 +156,64 @@ def main():
     kaomoji_data = load_json_data(BASE_JSON_FILE)
     print("Starting the merge process...")
 
-    master_set = set()
-    for main_cat in kaomoji_data:
-        for sub_cat in main_cat.get('categories', []):
-            master_set.update(sub_cat.get('emoticons', []))
+    # A single comprehension lets the set constructor pre-size its table
+    # instead of growing through many small update() calls.
+    master_set = {emoticon
+                  for main_cat in kaomoji_data
+                  for sub_cat in main_cat.get('categories', ())
+                  for emoticon in sub_cat.get('emoticons', ())}
+
+    # Read every rule's source files up front on worker threads so the
+    # file I/O overlaps; the merge loop below then only touches memory.
+    def read_rule_sources(rule):
+        kaomojis = set()
+        for source_filename in rule['sources']:
+            kaomojis |= read_kaomojis_from_file(SOURCE_DIR / source_filename)
+        return kaomojis
+
+    with ThreadPoolExecutor() as executor:
+        kaomojis_per_rule = list(executor.map(read_rule_sources, MAPPING))
+
+    # Index categories by name once so each rule does O(1) dict lookups
+    # instead of a linear scan per rule.
+    main_index = {cat['name']: cat for cat in kaomoji_data}
+    sub_index = {
+        cat['name']: {sub['name']: sub for sub in cat.get('categories', [])}
+        for cat in kaomoji_data
+    }
 
-    for rule in MAPPING:
+    for rule, new_kaomojis_from_files in zip(MAPPING, kaomojis_per_rule):
         main_cat_name = rule['main_category']
         sub_cat_name = rule['sub_category']
 
         print(f"Processing rule for '{main_cat_name} -> {sub_cat_name}'...")
 
-        new_kaomojis_from_files = []
-        for source_filename in rule['sources']:
-            filepath = SOURCE_DIR / source_filename
-            new_kaomojis_from_files.extend(read_kaomojis_from_file(filepath))
-
         if not new_kaomojis_from_files:
             continue
 
-        main_cat_obj = next((cat for cat in kaomoji_data if cat['name'] == main_cat_name), None)
+        main_cat_obj = main_index.get(main_cat_name)
         if not main_cat_obj:
             print(f"  - Error: Main category '{main_cat_name}' not found. Check MAPPING.")
             continue
 
-        sub_cat_obj = next((scat for scat in main_cat_obj['categories'] if scat['name'] == sub_cat_name), None)
+        sub_cat_obj = sub_index[main_cat_name].get(sub_cat_name)
 
         if sub_cat_obj is None:
             print(f"  - Creating new sub-category: '{sub_cat_name}'")
             sub_cat_obj = {'name': sub_cat_name, 'emoticons': []}
             main_cat_obj['categories'].append(sub_cat_obj)
+            sub_index[main_cat_name][sub_cat_name] = sub_cat_obj
 
-        existing_emoticons = set(sub_cat_obj['emoticons'])
-        unique_new_kaomojis = {k for k in new_kaomojis_from_files if k not in master_set}
+        # The sources were already read as a set, so this is a single
+        # C-level difference with no per-element membership test.
+        unique_new_kaomojis = new_kaomojis_from_files - master_set
 
         added_count = len(unique_new_kaomojis)
         if added_count > 0:
             print(f"  - Adding {added_count} new unique kaomojis.")
 
-        combined_set = existing_emoticons.union(unique_new_kaomojis)
-        sub_cat_obj['emoticons'] = sorted(list(combined_set))
-        master_set.update(unique_new_kaomojis)
+        sub_cat_obj['emoticons'] = sorted({*sub_cat_obj['emoticons'], *unique_new_kaomojis})
+        master_set |= unique_new_kaomojis
 
     save_json_data(kaomoji_data, OUTPUT_JSON_FILE)
 
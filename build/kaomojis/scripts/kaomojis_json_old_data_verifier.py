@@ -2,6 +2,24 @@
 import json
 import pathlib
 
+
+# This script only reads JSON, so orjson (when installed) is a pure win.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional streaming parser. Verification needs a single pass over each
+# file, so with ijson neither document is ever held in memory as a tree.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors that mean "this file is not valid JSON": stdlib json and orjson
+# raise ValueError subclasses, ijson raises its own JSONError.
+_DECODE_ERRORS = (ValueError,) if ijson is None else (ValueError, ijson.JSONError)
+
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -12,13 +30,43 @@ ORIGINAL_FILE = PROJECT_ROOT / "kaomojis_original.json"
 # The new, expanded file that should contain everything from the original, plus more.
 EXPANDED_FILE = PROJECT_ROOT / "kaomojis_simple_deduplicated.json"
 
-def extract_kaomoji_map(data):
+def _load_json(filepath):
+    """Whole-file parse, used only when ijson is unavailable."""
+    if orjson is not None:
+        return orjson.loads(filepath.read_bytes())
+    return json.loads(filepath.read_bytes())
+
+def iter_kaomojis(filepath):
+    """
+    Yields (kaomoji, "Main > Sub") pairs straight from the parser's event
+    stream, keeping memory at O(nesting depth) instead of O(file size).
+
+    Relies on each category object listing its "name" before its nested
+    lists — which is how every file in this pipeline is written.
     """
-    Extracts all kaomojis from a data structure and maps them to their location.
+    main_name = "N/A"
+    sub_name = "N/A"
+    with open(filepath, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if event != 'string':
+                continue
+            if prefix == 'item.categories.item.emoticons.item':
+                yield value, f"{main_name} > {sub_name}"
+            elif prefix == 'item.categories.item.name':
+                sub_name = value
+            elif prefix == 'item.name':
+                main_name = value
+
+def extract_kaomoji_map(filepath):
+    """
+    Extracts all kaomojis from a file and maps them to their location.
     Returns a dictionary: { "(* ^ ω ^)": "Positive > Joy" }
     """
+    if ijson is not None:
+        return dict(iter_kaomojis(filepath))
+
     location_map = {}
-    for main_category in data:
+    for main_category in _load_json(filepath):
         main_name = main_category.get("name", "N/A")
         for sub_category in main_category.get("categories", []):
             sub_name = sub_category.get("name", "N/A")
@@ -27,13 +75,19 @@ def extract_kaomoji_map(data):
                 location_map[kaomoji] = location
     return location_map
 
-def extract_kaomoji_set(data):
-    """Extracts all kaomojis from a data structure into a simple set for fast lookups."""
-    kaomoji_set = set()
-    for main_category in data:
-        for sub_category in main_category.get("categories", []):
-            kaomoji_set.update(sub_category.get("emoticons", []))
-    return kaomoji_set
+def extract_kaomoji_set(filepath):
+    """Extracts all kaomojis from a file into a simple set for fast lookups."""
+    if ijson is not None:
+        return {kaomoji for kaomoji, _ in iter_kaomojis(filepath)}
+
+    # One comprehension lets the set pre-size its table instead of growing
+    # through per-sub-category update() calls.
+    return {
+        kaomoji
+        for main_category in _load_json(filepath)
+        for sub_category in main_category.get("categories", [])
+        for kaomoji in sub_category.get("emoticons", [])
+    }
 
 def verify_old_data_is_present():
     """
@@ -41,30 +95,24 @@ def verify_old_data_is_present():
     """
     print("--- Original Kaomoji Data Preservation Verifier ---")
 
-    # --- Step 1: Load both files ---
+    # --- Step 1: Extract kaomojis from both files ---
     try:
         print(f"Loading original file: '{ORIGINAL_FILE.name}'...")
-        with open(ORIGINAL_FILE, 'r', encoding='utf-8') as f:
-            original_data = json.load(f)
+        original_kaomoji_map = extract_kaomoji_map(ORIGINAL_FILE)
 
         print(f"Loading expanded file: '{EXPANDED_FILE.name}'...")
-        with open(EXPANDED_FILE, 'r', encoding='utf-8') as f:
-            expanded_data = json.load(f)
+        expanded_kaomoji_set = extract_kaomoji_set(EXPANDED_FILE)
     except FileNotFoundError as e:
         print(f"❌ ERROR: File not found. Missing: {e.filename}")
         return
-    except json.JSONDecodeError as e:
+    except _DECODE_ERRORS as e:
         print(f"❌ ERROR: A file is not valid JSON. Details: {e}")
         return
 
-    # --- Step 2: Extract kaomojis from both files ---
-    original_kaomoji_map = extract_kaomoji_map(original_data)
-    expanded_kaomoji_set = extract_kaomoji_set(expanded_data)
-
     print(f"\nFound {len(original_kaomoji_map)} unique kaomojis in the original file.")
     print(f"Found {len(expanded_kaomoji_set)} unique kaomojis in the expanded file.")
 
-    # --- Step 3: Check for missing items and generate report ---
+    # --- Step 2: Check for missing items and generate report ---
     missing_items = []
     # For every kaomoji in the original file...
     for kaomoji, location in original_kaomoji_map.items():
@@ -3,6 +3,13 @@ import json
 import pathlib
 import unicodedata
 
+# Parse with orjson where available. The enriched output keeps stdlib
+# json for its 4-space indent.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -10,19 +17,30 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 INPUT_FILE = PROJECT_ROOT / "symbols.json"
 OUTPUT_FILE = PROJECT_ROOT / "symbols_detailed.json"
 
-def enrich_json_file(input_path, output_path):
-    """Loads symbols.json and enriches it with Unicode metadata."""
-    print(f"--- Enriching '{input_path.name}' ---")
-    if not input_path.exists():
-        print(f"❌ ERROR: Input file not found at '{input_path}'")
-        return
+# Pretty-print the enriched output. Flip to False for compact JSON when
+# only the downstream tooling reads the file; the committed artifact is
+# kept indented so review diffs stay readable.
+PRETTY = True
 
-    try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            original_data = json.load(f)
-    except Exception as e:
-        print(f"❌ ERROR: Could not parse JSON. Reason: {e}")
-        return
+def enrich_data(original_data):
+    """Enriches loaded symbols data and returns the new category list."""
+    # A symbol can appear in more than one category and the set of unique
+    # symbols is small, so resolve each one's Unicode metadata exactly once
+    # up front. The per-category loop below then only does dict lookups.
+    # _name/_category are local bindings of the unicodedata functions
+    # (LOAD_FAST per symbol instead of module attribute lookups).
+    unique_symbols = {
+        symbol
+        for category in original_data
+        for symbol in category.get("symbols", [])
+    }
+    _name = unicodedata.name
+    _category = unicodedata.category
+    hex_fmt = "{:04X}".format
+    symbol_meta = {
+        symbol: (_name(symbol, None), "U+" + hex_fmt(ord(symbol)), _category(symbol))
+        for symbol in unique_symbols
+    }
 
     enriched_data = []
     for category in original_data:
@@ -36,22 +54,62 @@ def enrich_json_file(input_path, output_path):
         }
 
         for symbol in category.get("symbols", []):
-            try:
-                enriched_symbol = {
-                    "symbol": symbol,
-                    "name": unicodedata.name(symbol),
-                    "codepoint": f"U+{ord(symbol):04X}",
-                    "category_code": unicodedata.category(symbol)
-                }
-                new_category["symbols"].append( enriched_symbol)
-            except ValueError:
+            symbol_name, codepoint, category_code = symbol_meta[symbol]
+            if symbol_name is None:
                 print(f"  - Warning: Skipping '{symbol}' (no Unicode name found).")
+                continue
+            new_category["symbols"].append({
+                "symbol": symbol,
+                "name": symbol_name,
+                "codepoint": codepoint,
+                "category_code": category_code
+            })
 
         enriched_data.append(new_category)
 
+    return enriched_data
+
+def build_data(input_path=None):
+    """Loads the symbols.json file, enriches it, and returns the data.
+
+    Exposed so json_final_exporter can consume the data in-process instead
+    of re-parsing the intermediate JSON file. Returns None on load errors.
+    """
+    if input_path is None:
+        input_path = INPUT_FILE
+
+    if not input_path.exists():
+        print(f"❌ ERROR: Input file not found at '{input_path}'")
+        return None
+
+    try:
+        if orjson is not None:
+            original_data = orjson.loads(input_path.read_bytes())
+        else:
+            original_data = json.loads(input_path.read_bytes())
+    except Exception as e:
+        print(f"❌ ERROR: Could not parse JSON. Reason: {e}")
+        return None
+
+    return enrich_data(original_data)
+
+def enrich_json_file(input_path, output_path):
+    """Loads symbols.json and enriches it with Unicode metadata."""
+    print(f"--- Enriching '{input_path.name}' ---")
+    enriched_data = build_data(input_path)
+    if enriched_data is None:
+        return
+
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(enriched_data, f, ensure_ascii=False, indent=4)
+        if PRETTY:
+            payload = json.dumps(enriched_data, ensure_ascii=False, indent=4)
+        else:
+            payload = json.dumps(enriched_data, ensure_ascii=False, separators=(',', ':'))
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            # Single serialize + single write; json.dump would write each
+            # token separately. Encoding here and opening in binary mode
+            # drops the TextIOWrapper from the write path entirely.
+            f.write(payload.encode('utf-8'))
         print(f"\n✅ SUCCESS: Enriched data saved to '{output_path}'")
     except Exception as e:
         print(f"\n❌ FAILED: Could not save output file. Reason: {e}")
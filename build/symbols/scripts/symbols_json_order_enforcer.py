@@ -1,8 +1,16 @@
 # ./scripts/symbols_json_order_enforcer.py
 import json
+import os
 import pathlib
 import shutil
 
+# Faster parsing via orjson when installed; the rewrite below stays on
+# stdlib json to preserve the 4-space indent.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -18,42 +26,53 @@ def sort_symbols_in_place(filepath):
         print(f"❌ ERROR: File not found at '{filepath}'")
         return
 
-    # Create a backup
-    backup_path = filepath.with_suffix(".json.bak")
-    try:
-        shutil.copy(filepath, backup_path)
-        print(f"Created backup: '{backup_path.name}'")
-    except Exception as e:
-        print(f"❌ ERROR: Could not create backup file. Aborting. Reason: {e}")
-        return
-
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(filepath.read_bytes())
+        else:
+            data = json.loads(filepath.read_bytes())
     except Exception as e:
         print(f"❌ ERROR: Could not parse JSON file. Aborting. Reason: {e}")
         return
 
     changes_made = False
+    _ord = ord  # local binding: the scan below calls it twice per element
     for category in data:
         if "symbols" in category and isinstance(category["symbols"], list):
-            original_list = category["symbols"].copy()
-            # Sort the list in-place using the Unicode value (ord)
-            category["symbols"].sort(key=ord)
-            if original_list != category["symbols"]:
+            symbols = category["symbols"]
+            # A linear scan for an out-of-order pair replaces the old
+            # copy-sort-compare: no O(n) copy, and the sort itself only
+            # runs when a category actually needs it.
+            if any(_ord(symbols[i]) > _ord(symbols[i + 1])
+                   for i in range(len(symbols) - 1)):
+                # Sort the list in-place by Unicode value; single-codepoint
+                # strings already compare by codepoint, so no key callable
+                # is needed.
+                symbols.sort()
                 print(f"Sorted symbols in category: '{category.get('name')}'")
                 changes_made = True
 
     if not changes_made:
         print("No changes needed. All categories were already sorted.")
-        backup_path.unlink() # Remove the unnecessary backup
-        print("Removed backup file.")
         return
 
-    # Save the modified data back to the original file
+    # Only now that we know the file will change is a backup worth the I/O.
+    backup_path = filepath.with_suffix(".json.bak")
+    try:
+        shutil.copy(filepath, backup_path)
+        print(f"Created backup: '{backup_path.name}'")
+    except Exception as e:
+        print(f"❌ ERROR: Could not create backup file. Aborting. Reason: {e}")
+        return
+
+    # Save the modified data by writing a temp file and atomically swapping
+    # it into place, so a crash mid-write can never truncate the original.
+    tmp_path = filepath.with_suffix(".json.tmp")
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            # Serialize in one go so the save is a single write() call.
+            f.write(json.dumps(data, ensure_ascii=False, indent=4))
+        os.replace(tmp_path, filepath)
         print(f"\n✅ SUCCESS: Successfully sorted and saved changes to '{filepath.name}'")
     except Exception as e:
         print(f"\n❌ FAILED: Could not save changes. Reason: {e}")
@@ -2,6 +2,19 @@
 import json
 import pathlib
 
+# Read-only verification: orjson just makes the load faster when present.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# With ijson the check runs over the parse events directly, so the file
+# is never loaded as a tree and order is checked on the fly.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -14,27 +27,64 @@ def verify_symbol_order(filepath):
         print(f"❌ ERROR: File not found at '{filepath}'")
         return
 
+    is_fully_sorted = True
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if ijson is not None:
+            # Single pass over the event stream: per category, remember the
+            # previous codepoint and flag the first one that goes backwards.
+            # No in-memory tree and no sorted() copy per category.
+            with open(filepath, 'rb') as f:
+                _ord = ord  # local binding for the per-symbol call below
+                name = "Unknown"
+                symbol_count = 0
+                prev_codepoint = -1
+                in_order = True
+                for prefix, event, value in ijson.parse(f):
+                    if prefix == 'item.symbols.item' and event == 'string':
+                        codepoint = _ord(value)
+                        if codepoint < prev_codepoint:
+                            in_order = False
+                        prev_codepoint = codepoint
+                        symbol_count += 1
+                    elif prefix == 'item.name' and event == 'string':
+                        name = value
+                    elif prefix == 'item' and event == 'start_map':
+                        name = "Unknown"
+                        symbol_count = 0
+                        prev_codepoint = -1
+                        in_order = True
+                    elif prefix == 'item' and event == 'end_map':
+                        if not symbol_count:
+                            print(f"⚪ Category '{name}': No symbols to check.")
+                        elif not in_order:
+                            print(f"❌ Category '{name}': NOT sorted correctly.")
+                            is_fully_sorted = False
+        else:
+            if orjson is not None:
+                data = orjson.loads(filepath.read_bytes())
+            else:
+                data = json.loads(filepath.read_bytes())
+
+            for category in data:
+                name = category.get("name", "Unknown")
+                symbols = category.get("symbols", [])
+
+                if not symbols:
+                    print(f"⚪ Category '{name}': No symbols to check.")
+                    continue
+
+                # Linear scan instead of comparing against a sorted copy:
+                # O(n) with no allocation, and it stops at the first
+                # out-of-order pair — same check the streaming path does.
+                _ord = ord
+                if any(_ord(symbols[i]) > _ord(symbols[i + 1])
+                       for i in range(len(symbols) - 1)):
+                    print(f"❌ Category '{name}': NOT sorted correctly.")
+                    is_fully_sorted = False
     except Exception as e:
         print(f"❌ ERROR: Could not parse JSON file. Reason: {e}")
         return
 
-    is_fully_sorted = True
-    for category in data:
-        name = category.get("name", "Unknown")
-        symbols = category.get("symbols", [])
-
-        if not symbols:
-            print(f"⚪ Category '{name}': No symbols to check.")
-            continue
-
-        sorted_symbols = sorted(symbols, key=ord)
-        if symbols != sorted_symbols:
-            print(f"❌ Category '{name}': NOT sorted correctly.")
-            is_fully_sorted = False
-
     print("\n--- Verification Complete ---")
     if is_fully_sorted:
         print("✅ SUCCESS: All categories are perfectly sorted by Unicode codepoint!")
@@ -1,6 +1,6 @@
 # ./scripts/symbols_json_structure_creator.py
 import json
-import re
+import mmap
 import pathlib
 
 # --- Configuration ---
@@ -26,29 +26,45 @@ SOURCE_FILENAMES = [
 
 def clean_category_name(filename):
     """Creates a clean category name from a filename."""
-    name = re.sub(r'\[Microsoft\]\s*', '', filename)
-    name = name.replace('.txt', '')
-    return name.strip()
+    # The prefix and suffix are fixed literals, so plain string methods do
+    # the job without the regex engine.
+    return filename.removeprefix('[Microsoft] ').removesuffix('.txt').strip()
 
 def read_symbols_from_file(filepath):
     """Reads all characters from a file, treating each as a potential symbol."""
     if not filepath.exists():
         print(f"Warning: Source file '{filepath.name}' not found. Skipping.")
-        return []
+        return set()
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-        # Return a list of all non-whitespace characters
-        return [char for char in content if not char.isspace()]
+    if filepath.stat().st_size == 0:
+        return set()
+
+    # Map the file and decode it in one shot, bypassing the TextIOWrapper's
+    # incremental decode and its extra buffering.
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = mm[:].decode('utf-8')
+
+    # split()/join() drops all whitespace in one C-level pass (same
+    # semantics as char.isspace()), and building the set directly skips
+    # the intermediate per-character list.
+    return set(''.join(content.split()))
 
 def save_json_data(data, filepath):
     """Saves the final data structure to the JSON file."""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    with open(filepath, 'wb', buffering=1 << 20) as f:
+        # Serialize in one go and emit a single write() instead of the many
+        # small writes json.dump issues per token; writing the encoded
+        # bytes directly avoids the text wrapper's own encode step.
+        f.write(json.dumps(data, ensure_ascii=False, indent=4).encode('utf-8'))
     print(f"\nSuccessfully created symbol library: '{filepath}'")
 
-def main():
-    """Main function to build the symbols JSON."""
+def build_data():
+    """Builds and returns the symbol category list without touching disk output.
+
+    Exposed so json_final_exporter can consume the data in-process instead
+    of re-parsing the intermediate JSON file.
+    """
     final_data = []
     print("Starting to build Unicode symbol library...")
 
@@ -61,8 +77,11 @@ def main():
             continue
 
         print(f"Processing '{category_name}'...")
-        # Deduplicate and sort symbols by Unicode value
-        unique_sorted_symbols = sorted(list(set(symbols)), key=ord)
+        # Sort the already-deduplicated symbols by Unicode value. The
+        # symbols are single-codepoint strings, which Python compares by
+        # codepoint anyway, so the default sort gives the key=ord order
+        # without a Python-level key call per element.
+        unique_sorted_symbols = sorted(symbols)
 
         category_object = {
             "name": category_name,
@@ -70,7 +89,11 @@ def main():
         }
         final_data.append(category_object)
 
-    save_json_data(final_data, OUTPUT_FILE)
+    return final_data
+
+def main():
+    """Main function to build the symbols JSON."""
+    save_json_data(build_data(), OUTPUT_FILE)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
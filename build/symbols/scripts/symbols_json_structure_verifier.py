@@ -2,6 +2,12 @@
 import json
 import pathlib
 
+# orjson, when installed, speeds up the only expensive step here: parsing.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration ---
 SCRIPT_DIR = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -15,8 +21,10 @@ def verify_json_structure(filepath):
         return False
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(filepath.read_bytes())
+        else:
+            data = json.loads(filepath.read_bytes())
     except Exception as e:
         print(f"❌ ERROR: Could not read or parse JSON file. Reason: {e}")
         return False